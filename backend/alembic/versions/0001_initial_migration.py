@@ -46,14 +46,21 @@ def upgrade() -> None:
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        # Indexes are declared inline so they are built as part of table creation
+        sa.Index(op.f('ix_domains_domain_name'), 'domain_name', unique=True),
+        sa.Index(op.f('ix_domains_risk_score'), 'risk_score'),
+        sa.Index(op.f('ix_domains_created_at'), 'created_at'),
+        # Composite and partial indexes for the paginated list/filter queries
+        sa.Index('ix_domains_risk_level_created_at', 'risk_level', sa.text('created_at DESC')),
+        sa.Index('ix_domains_risk_level_score', 'risk_level', 'risk_score'),
+        sa.Index(
+            'ix_domains_active_created_at',
+            'created_at',
+            postgresql_where=sa.text('is_active = true'),
+        ),
     )
     
-    # Create indexes
-    op.create_index(op.f('ix_domains_domain_name'), 'domains', ['domain_name'], unique=True)
-    op.create_index(op.f('ix_domains_risk_score'), 'domains', ['risk_score'])
-    op.create_index(op.f('ix_domains_created_at'), 'domains', ['created_at'])
-    
     # Create domain_enrichments table
     op.create_table('domain_enrichments',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -67,14 +74,12 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.Column('updated_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['domain_id'], ['domains.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index(op.f('ix_domain_enrichments_domain_id'), 'domain_id'),
+        sa.Index(op.f('ix_domain_enrichments_source'), 'source'),
+        sa.Index(op.f('ix_domain_enrichments_created_at'), 'created_at'),
     )
     
-    # Create indexes
-    op.create_index(op.f('ix_domain_enrichments_domain_id'), 'domain_enrichments', ['domain_id'])
-    op.create_index(op.f('ix_domain_enrichments_source'), 'domain_enrichments', ['source'])
-    op.create_index(op.f('ix_domain_enrichments_created_at'), 'domain_enrichments', ['created_at'])
-    
     # Create domain_scans table
     op.create_table('domain_scans',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -90,14 +95,13 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['domain_id'], ['domains.id'], ),
         sa.ForeignKeyConstraint(['previous_scan_id'], ['domain_scans.id'], ),
-        sa.PrimaryKeyConstraint('id')
+        sa.PrimaryKeyConstraint('id'),
+        sa.Index(op.f('ix_domain_scans_domain_id'), 'domain_id'),
+        sa.Index(op.f('ix_domain_scans_previous_scan_id'), 'previous_scan_id'),
+        sa.Index(op.f('ix_domain_scans_scan_type'), 'scan_type'),
+        sa.Index(op.f('ix_domain_scans_created_at'), 'created_at'),
     )
     
-    # Create indexes
-    op.create_index(op.f('ix_domain_scans_domain_id'), 'domain_scans', ['domain_id'])
-    op.create_index(op.f('ix_domain_scans_scan_type'), 'domain_scans', ['scan_type'])
-    op.create_index(op.f('ix_domain_scans_created_at'), 'domain_scans', ['created_at'])
-    
     # Create news_feed_items table
     op.create_table('news_feed_items',
         sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
@@ -112,13 +116,11 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=True),
         sa.Column('updated_at', sa.DateTime(), nullable=True),
         sa.PrimaryKeyConstraint('id'),
-        sa.UniqueConstraint('link')
+        sa.UniqueConstraint('link'),
+        sa.Index(op.f('ix_news_feed_items_source'), 'source'),
+        sa.Index(op.f('ix_news_feed_items_published_at'), 'published_at'),
+        sa.Index(op.f('ix_news_feed_items_created_at'), 'created_at'),
     )
-    
-    # Create indexes
-    op.create_index(op.f('ix_news_feed_items_source'), 'news_feed_items', ['source'])
-    op.create_index(op.f('ix_news_feed_items_published_at'), 'news_feed_items', ['published_at'])
-    op.create_index(op.f('ix_news_feed_items_created_at'), 'news_feed_items', ['created_at'])
 
 
 def downgrade() -> None:
@@ -131,6 +133,7 @@ def downgrade() -> None:
     # Drop domain_scans table
     op.drop_index(op.f('ix_domain_scans_created_at'), table_name='domain_scans')
     op.drop_index(op.f('ix_domain_scans_scan_type'), table_name='domain_scans')
+    op.drop_index(op.f('ix_domain_scans_previous_scan_id'), table_name='domain_scans')
     op.drop_index(op.f('ix_domain_scans_domain_id'), table_name='domain_scans')
     op.drop_table('domain_scans')
     
@@ -141,6 +144,9 @@ def downgrade() -> None:
     op.drop_table('domain_enrichments')
     
     # Drop domains table
+    op.drop_index('ix_domains_active_created_at', table_name='domains')
+    op.drop_index('ix_domains_risk_level_score', table_name='domains')
+    op.drop_index('ix_domains_risk_level_created_at', table_name='domains')
     op.drop_index(op.f('ix_domains_updated_at'), table_name='domains')
     op.drop_index(op.f('ix_domains_created_at'), table_name='domains')
     op.drop_index(op.f('ix_domains_risk_score'), table_name='domains')
@@ -0,0 +1,46 @@
+"""Risk trends materialized view
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2024-02-10 12:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Materialized views are PostgreSQL-only; other backends aggregate at query time
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_risk_trends_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            coalesce(risk_level, 'low') AS risk_level,
+            count(*) AS domain_count,
+            sum(coalesce(risk_score, 0)) AS risk_score_sum
+        FROM domains
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, 2
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index covering every row
+    op.execute(
+        'CREATE UNIQUE INDEX ix_mv_risk_trends_daily_day_level '
+        'ON mv_risk_trends_daily (day, risk_level)'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
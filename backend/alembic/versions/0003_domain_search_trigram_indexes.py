@@ -0,0 +1,47 @@
+"""Trigram indexes for domain search
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-02-17 12:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# Columns matched with ILIKE '%term%' by DomainService.search_domains
+SEARCH_COLUMNS = (
+    'domain_name',
+    'registrar',
+    'registrant_name',
+    'registrant_organization',
+    'registrant_email',
+    'certificate_issuer',
+    'certificate_subject',
+)
+
+
+def upgrade() -> None:
+    # pg_trgm is PostgreSQL-only; other backends keep scanning for substring search
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # Leading-wildcard ILIKE can't use a B-tree; GIN trigram indexes serve it directly
+    for column in SEARCH_COLUMNS:
+        op.execute(
+            f'CREATE INDEX IF NOT EXISTS ix_domains_{column}_trgm '
+            f'ON domains USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in SEARCH_COLUMNS:
+        op.execute(f'DROP INDEX IF EXISTS ix_domains_{column}_trgm')
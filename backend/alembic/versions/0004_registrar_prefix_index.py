@@ -0,0 +1,33 @@
+"""Prefix-pattern index on registrar
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-02-24 12:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Operator classes are PostgreSQL-only; other backends scan for pattern filters
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Serves anchored lower(registrar) LIKE 'foo%' filters regardless of the collation
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_domains_registrar_lower_pattern '
+        'ON domains (lower(registrar) text_pattern_ops)'
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_domains_registrar_lower_pattern')
@@ -0,0 +1,41 @@
+"""Generated TLD column on domains
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2024-03-02 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+# Last dot-separated label (the whole name when there is no dot), matching
+# app.db.functions.last_label
+LAST_LABEL_SQL = {
+    'postgresql': "reverse(split_part(reverse(domain_name), '.', 1))",
+    'sqlite': "replace(domain_name, rtrim(domain_name, replace(domain_name, '.', '')), '')",
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    # SQLite can only add virtual generated columns to an existing table
+    op.add_column(
+        'domains',
+        sa.Column(
+            'tld',
+            sa.String(255),
+            sa.Computed(sa.text(LAST_LABEL_SQL.get(dialect, LAST_LABEL_SQL['postgresql'])), persisted=dialect != 'sqlite'),
+        ),
+    )
+    op.create_index('ix_domains_tld', 'domains', ['tld'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_domains_tld', table_name='domains')
+    op.drop_column('domains', 'tld')
@@ -0,0 +1,32 @@
+"""Keyset pagination indexes on domains
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2024-03-09 12:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# Sort columns accepted by DomainService listings, each paired with the id tiebreak
+KEYSET_COLUMNS = (
+    'created_at',
+    'risk_score',
+    'domain_name',
+)
+
+
+def upgrade() -> None:
+    # (column, id) row comparisons seek straight to the cursor in either direction
+    for column in KEYSET_COLUMNS:
+        op.create_index(f'ix_domains_{column}_id', 'domains', [column, 'id'])
+
+
+def downgrade() -> None:
+    for column in KEYSET_COLUMNS:
+        op.drop_index(f'ix_domains_{column}_id', table_name='domains')
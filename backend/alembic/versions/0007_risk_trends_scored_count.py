@@ -0,0 +1,56 @@
+"""Keep unscored domains out of risk trend averages
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2024-03-16 12:00:00
+
+"""
+from alembic import op
+
+# revision identifiers
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def _create_view(scored: bool) -> None:
+    if scored:
+        # NULL scores stay out of both the sum and scored_count, like avg() does
+        score_columns = 'count(risk_score) AS scored_count, sum(risk_score) AS risk_score_sum'
+    else:
+        score_columns = 'sum(coalesce(risk_score, 0)) AS risk_score_sum'
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_risk_trends_daily AS
+        SELECT
+            date_trunc('day', created_at) AS day,
+            coalesce(risk_level, 'low') AS risk_level,
+            count(*) AS domain_count,
+            {score_columns}
+        FROM domains
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, 2
+        """
+    )
+    # REFRESH ... CONCURRENTLY requires a unique index covering every row
+    op.execute(
+        'CREATE UNIQUE INDEX ix_mv_risk_trends_daily_day_level '
+        'ON mv_risk_trends_daily (day, risk_level)'
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    _create_view(scored=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    _create_view(scored=False)
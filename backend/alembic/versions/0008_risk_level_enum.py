@@ -0,0 +1,78 @@
+"""Native enum type for risk_level
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2024-03-23 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+risk_level_t = postgresql.ENUM('low', 'medium', 'high', 'critical', name='risk_level_t')
+
+RISK_LEVEL_TABLES = (
+    'domains',
+    'domain_scans',
+)
+
+# mv_risk_trends_daily as of 0007; a column a view depends on can't change type
+RISK_TRENDS_VIEW_SQL = """
+    CREATE MATERIALIZED VIEW mv_risk_trends_daily AS
+    SELECT
+        date_trunc('day', created_at) AS day,
+        coalesce(risk_level, 'low') AS risk_level,
+        count(*) AS domain_count,
+        count(risk_score) AS scored_count,
+        sum(risk_score) AS risk_score_sum
+    FROM domains
+    WHERE created_at IS NOT NULL
+    GROUP BY 1, 2
+"""
+
+
+def _create_risk_trends_view() -> None:
+    op.execute(RISK_TRENDS_VIEW_SQL)
+    op.execute(
+        'CREATE UNIQUE INDEX ix_mv_risk_trends_daily_day_level '
+        'ON mv_risk_trends_daily (day, risk_level)'
+    )
+
+
+def upgrade() -> None:
+    # Enum types are PostgreSQL-only; other backends keep the VARCHAR column
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    risk_level_t.create(op.get_bind(), checkfirst=True)
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    for table in RISK_LEVEL_TABLES:
+        op.alter_column(
+            table,
+            'risk_level',
+            type_=risk_level_t,
+            postgresql_using='risk_level::risk_level_t',
+        )
+    _create_risk_trends_view()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    for table in RISK_LEVEL_TABLES:
+        op.alter_column(
+            table,
+            'risk_level',
+            type_=sa.String(length=50),
+            postgresql_using='risk_level::text',
+        )
+    risk_level_t.drop(op.get_bind(), checkfirst=True)
+    _create_risk_trends_view()
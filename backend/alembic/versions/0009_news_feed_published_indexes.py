@@ -0,0 +1,38 @@
+"""Newest-first indexes on news_feed_items
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2024-03-30 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Newest-first feed paging, optionally narrowed to a single source
+    op.create_index(
+        'ix_news_feed_items_source_published_at',
+        'news_feed_items',
+        ['source', sa.text('published_at DESC')],
+    )
+    # Latest-N listing walks this in order; source rides along for filtered pages.
+    # It leads with published_at, so it replaces the single-column index.
+    op.create_index(
+        'ix_news_feed_items_published_source',
+        'news_feed_items',
+        [sa.text('published_at DESC'), 'source'],
+    )
+    op.drop_index('ix_news_feed_items_published_at', table_name='news_feed_items')
+
+
+def downgrade() -> None:
+    op.create_index('ix_news_feed_items_published_at', 'news_feed_items', ['published_at'])
+    op.drop_index('ix_news_feed_items_published_source', table_name='news_feed_items')
+    op.drop_index('ix_news_feed_items_source_published_at', table_name='news_feed_items')
@@ -0,0 +1,60 @@
+"""JSONB risk columns with GIN indexes on domains
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2024-04-06 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+# JSON columns filtered with containment (@>) by risk queries
+JSONB_COLUMNS = (
+    'risk_factors',
+    'threat_indicators',
+)
+
+
+def upgrade() -> None:
+    # Top-risk listings of active domains
+    op.create_index('ix_domains_active_risk_score', 'domains', ['is_active', sa.text('risk_score DESC')])
+
+    # JSONB and GIN are PostgreSQL-only; other backends keep JSON and scan
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for column in JSONB_COLUMNS:
+        op.alter_column(
+            'domains',
+            column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb',
+        )
+        op.create_index(
+            f'ix_domains_{column}_gin',
+            'domains',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in JSONB_COLUMNS:
+            op.drop_index(f'ix_domains_{column}_gin', table_name='domains')
+            op.alter_column(
+                'domains',
+                column,
+                type_=sa.JSON(),
+                postgresql_using=f'{column}::json',
+            )
+
+    op.drop_index('ix_domains_active_risk_score', table_name='domains')
@@ -0,0 +1,56 @@
+"""Native array type for domains.name_servers
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2024-04-13 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Arrays are PostgreSQL-only; other backends keep the JSON list
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # USING can't hold a subquery, so unnest the JSON list through a session-local
+    # function; anything but a JSON array (SQL or JSON null) becomes NULL
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.json_to_varchar_array(value json) RETURNS varchar(255)[] AS $$
+            SELECT CASE WHEN json_typeof(value) = 'array'
+                THEN ARRAY(SELECT json_array_elements_text(value))
+            END
+        $$ LANGUAGE sql IMMUTABLE
+        """
+    )
+    op.alter_column(
+        'domains',
+        'name_servers',
+        type_=postgresql.ARRAY(sa.String(length=255)),
+        postgresql_using='pg_temp.json_to_varchar_array(name_servers)',
+    )
+    op.execute('DROP FUNCTION pg_temp.json_to_varchar_array(json)')
+    # Finds domains on a name server with array containment (@>)
+    op.create_index('ix_domains_name_servers', 'domains', ['name_servers'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_domains_name_servers', table_name='domains')
+    op.alter_column(
+        'domains',
+        'name_servers',
+        type_=sa.JSON(),
+        postgresql_using='array_to_json(name_servers)',
+    )
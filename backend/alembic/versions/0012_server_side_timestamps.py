@@ -0,0 +1,83 @@
+"""Server-generated timestamptz created_at/updated_at
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2024-04-20 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+# Row timestamps per table, filled by now() instead of the application
+TIMESTAMP_COLUMNS = {
+    'domains': ('created_at', 'updated_at'),
+    'domain_enrichments': ('created_at', 'updated_at'),
+    'domain_scans': ('created_at',),
+    'news_feed_items': ('created_at', 'updated_at'),
+}
+
+
+# mv_risk_trends_daily as of 0007, rebuilt around the ALTERs since a column a view
+# depends on can't change type
+def _create_risk_trends_view(day_column: str) -> None:
+    op.execute(
+        f"""
+        CREATE MATERIALIZED VIEW mv_risk_trends_daily AS
+        SELECT
+            date_trunc('day', {day_column}) AS day,
+            coalesce(risk_level, 'low') AS risk_level,
+            count(*) AS domain_count,
+            count(risk_score) AS scored_count,
+            sum(risk_score) AS risk_score_sum
+        FROM domains
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, 2
+        """
+    )
+    op.execute(
+        'CREATE UNIQUE INDEX ix_mv_risk_trends_daily_day_level '
+        'ON mv_risk_trends_daily (day, risk_level)'
+    )
+
+
+def upgrade() -> None:
+    # SQLite can't alter columns in place; create_all there already uses the model defaults
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            # Existing values were written with datetime.utcnow()
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+    # Keep bucketing by UTC day whatever the session time zone is at refresh
+    _create_risk_trends_view("created_at AT TIME ZONE 'UTC'")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_risk_trends_daily')
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                server_default=None,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+    _create_risk_trends_view('created_at')
@@ -0,0 +1,69 @@
+"""Native array types for news feed categories and tags
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2024-04-27 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+# Columns that held a JSON-encoded list of strings
+TAG_COLUMNS = (
+    'categories',
+    'tags',
+)
+
+
+def upgrade() -> None:
+    # Arrays are PostgreSQL-only; other backends keep the string column
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # USING can't hold a subquery, so parse through a session-local function;
+    # text that isn't a JSON array becomes NULL
+    op.execute(
+        """
+        CREATE FUNCTION pg_temp.json_text_to_array(value text) RETURNS text[] AS $$
+        BEGIN
+            IF json_typeof(value::json) = 'array' THEN
+                RETURN ARRAY(SELECT json_array_elements_text(value::json));
+            END IF;
+            RETURN NULL;
+        EXCEPTION WHEN invalid_text_representation THEN
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql IMMUTABLE
+        """
+    )
+    for column in TAG_COLUMNS:
+        op.alter_column(
+            'news_feed_items',
+            column,
+            type_=postgresql.ARRAY(sa.Text()),
+            postgresql_using=f'pg_temp.json_text_to_array({column})',
+        )
+    op.execute('DROP FUNCTION pg_temp.json_text_to_array(text)')
+    # Tag filters use array containment (@>)
+    op.create_index('ix_news_feed_items_tags', 'news_feed_items', ['tags'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_news_feed_items_tags', table_name='news_feed_items')
+    for column in TAG_COLUMNS:
+        op.alter_column(
+            'news_feed_items',
+            column,
+            type_=sa.String(),
+            postgresql_using=f'array_to_json({column})::text',
+        )
@@ -1,11 +1,14 @@
 """
 API dependencies for DomainSentry.
 """
+import time
+from functools import lru_cache
 from typing import Generator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -21,7 +24,13 @@ async def get_db() -> Generator[AsyncSession, None, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            # Services commit their own writes; only flush what is still pending
+            # so read-only requests skip the extra COMMIT round-trip.
+            if session.new or session.dirty or session.deleted:
+                await session.commit()
+        except HTTPException:
+            # Client errors (404 etc.) are not transaction failures
+            raise
         except Exception:
             await session.rollback()
             raise
@@ -33,6 +42,17 @@ async def get_db() -> Generator[AsyncSession, None, None]:
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> dict:
+    """
+    Decode and verify a JWT, memoized by the raw token string.
+    
+    Invalid tokens raise and are therefore never cached. Callers must
+    re-check the ``exp`` claim since a cached payload can outlive it.
+    """
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """
     Get current authenticated user from JWT token.
@@ -44,15 +64,14 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     )
     
     try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=["HS256"]
-        )
+        payload = _decode_token(credentials.credentials)
+        exp = payload.get("exp")
+        if exp is not None and exp < time.time():
+            raise credentials_exception
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     
     # In a real implementation, you would fetch user from database
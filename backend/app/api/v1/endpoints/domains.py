@@ -2,42 +2,82 @@
 Domain endpoints for DomainSentry API.
 """
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.api.deps import get_current_user, get_db
+from app.core.pagination import SortValue, decode_sort_cursor
 from app.models.domain import Domain
 from app.schemas.domain import (
     DomainCreate,
     DomainResponse,
+    DomainResponseAdapter,
     DomainUpdate,
     DomainListResponse,
     DomainSearchRequest,
+    DomainSortField,
+    RiskLevel,
+    SortOrder,
 )
-from app.services.domain_service import DomainService
+from app.services.domain_service import SORT_VALUE_TYPES, DomainService
 
 router = APIRouter()
 
 
+def _decode_position(
+    cursor: Optional[str],
+    sort_by: DomainSortField,
+) -> Optional[Tuple[Optional[SortValue], uuid.UUID]]:
+    """
+    Decode a domain listing cursor, rejecting malformed ones or ones from another sort field.
+    """
+    if not cursor:
+        return None
+    try:
+        position = decode_sort_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    # None marks a NULL sort value
+    if position[0] is not None and not isinstance(position[0], SORT_VALUE_TYPES[sort_by]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cursor does not match sort_by={sort_by}",
+        )
+    return position
+
+
+def _domain_response(domain: Domain) -> Response:
+    """
+    Serialize one ORM row through the shared adapter, skipping FastAPI's response_model pass.
+    """
+    item = DomainResponseAdapter.validate_python(domain, from_attributes=True)
+    return Response(content=DomainResponseAdapter.dump_json(item), media_type="application/json")
+
+
 @router.get("/", response_model=DomainListResponse)
 async def list_domains(
     db: AsyncSession = Depends(get_db),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
-    sort_by: str = Query("created_at"),
-    sort_order: str = Query("desc"),
-    risk_level: Optional[str] = None,
+    sort_by: DomainSortField = Query("created_at"),
+    sort_order: SortOrder = Query("desc"),
+    risk_level: Optional[RiskLevel] = Query(None),
     min_risk_score: Optional[float] = None,
     max_risk_score: Optional[float] = None,
+    cursor: Optional[str] = None,
 ):
     """
     List domains with pagination and filtering.
+    
+    Pass ``next_cursor`` from the response back as ``cursor`` to fetch the
+    next page without an OFFSET scan.
     """
+    position = _decode_position(cursor, sort_by)
     service = DomainService(db)
-    return await service.list_domains(
+    result = await service.list_domains(
         page=page,
         size=size,
         sort_by=sort_by,
@@ -45,7 +85,10 @@ async def list_domains(
         risk_level=risk_level,
         min_risk_score=min_risk_score,
         max_risk_score=max_risk_score,
+        cursor=position,
     )
+    # Already validated by the service; serialize without a second response_model pass
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.post("/search", response_model=DomainListResponse)
@@ -56,8 +99,10 @@ async def search_domains(
     """
     Search domains with advanced filters.
     """
+    position = _decode_position(search_request.cursor, search_request.sort_by)
     service = DomainService(db)
-    return await service.search_domains(search_request)
+    result = await service.search_domains(search_request, cursor=position)
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{domain_id}", response_model=DomainResponse)
@@ -77,7 +122,7 @@ async def get_domain(
             detail="Domain not found",
         )
     
-    return domain
+    return _domain_response(domain)
 
 
 @router.post("/", response_model=DomainResponse)
@@ -89,7 +134,7 @@ async def create_domain(
     Create a new domain.
     """
     service = DomainService(db)
-    return await service.create_domain(domain_data)
+    return _domain_response(await service.create_domain(domain_data))
 
 
 @router.put("/{domain_id}", response_model=DomainResponse)
@@ -110,7 +155,7 @@ async def update_domain(
             detail="Domain not found",
         )
     
-    return domain
+    return _domain_response(domain)
 
 
 @router.delete("/{domain_id}")
@@ -150,7 +195,7 @@ async def get_domain_by_name(
             detail="Domain not found",
         )
     
-    return domain
+    return _domain_response(domain)
 
 
 @router.get("/stats/summary")
@@ -2,39 +2,62 @@
 Domain enrichment endpoints for DomainSentry API.
 """
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.domain import DomainEnrichment
 from app.schemas.domain import DomainEnrichmentCreate, DomainEnrichmentResponse
 from app.services.enrichment_service import EnrichmentService
 
 router = APIRouter()
 
+# Serializes list bodies directly, skipping FastAPI's response_model pass
+_enrichment_list_adapter = TypeAdapter(List[DomainEnrichmentResponse])
+
 
 @router.get("/", response_model=List[DomainEnrichmentResponse])
 async def list_enrichments(
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    domain_id: uuid.UUID = None,
-    source: str = None,
-    enrichment_type: str = None,
+    cursor: Optional[str] = None,
+    domain_id: Optional[uuid.UUID] = None,
+    source: Optional[str] = None,
+    enrichment_type: Optional[str] = None,
 ):
     """
     List domain enrichments with optional filtering.
+    
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch
+    the next page without an OFFSET scan.
     """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
     service = EnrichmentService(db)
-    return await service.list_enrichments(
+    enrichments = await service.list_enrichments(
         skip=skip,
         limit=limit,
         domain_id=domain_id,
         source=source,
-        enrichment_type=enrich_type,
+        enrichment_type=enrichment_type,
+        cursor=position,
     )
+    
+    items = _enrichment_list_adapter.validate_python(enrichments, from_attributes=True)
+    response = Response(content=_enrichment_list_adapter.dump_json(items), media_type="application/json")
+    if len(enrichments) == limit:
+        last = enrichments[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    return response
 
 
 @router.get("/{enrichment_id}", response_model=DomainEnrichmentResponse)
@@ -69,14 +92,28 @@ async def create_enrichment(
     return await service.create_enrichment(enrichment_data)
 
 
+@router.post("/bulk")
+async def create_enrichments_bulk(
+    enrichments_data: List[DomainEnrichmentCreate],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create many domain enrichments in a single request.
+    """
+    service = EnrichmentService(db)
+    created = await service.create_enrichments_bulk(enrichments_data)
+    
+    return {"created": created}
+
+
 @router.get("/by-domain/{domain_id}", response_model=List[DomainEnrichmentResponse])
 async def get_enrichments_by_domain(
     domain_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    source: str = None,
-    enrichment_type: str = None,
+    source: Optional[str] = None,
+    enrichment_type: Optional[str] = None,
 ):
     """
     Get all enrichments for a specific domain.
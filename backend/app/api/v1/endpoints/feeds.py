@@ -3,12 +3,14 @@ Cyber news feed endpoints for DomainSentry API.
 """
 from typing import List
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import get_current_user, get_db
 from app.schemas.feed import NewsFeedItem, NewsFeedResponse
 from app.services.feed_service import FeedService
+from app.tasks.worker import refresh_all_feeds
 
 router = APIRouter()
 
@@ -27,17 +29,14 @@ async def get_news_feeds(
 
 
 @router.get("/refresh")
-async def refresh_news_feeds(
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
-):
+async def refresh_news_feeds():
     """
-    Refresh all news feeds in background.
+    Queue a refresh of all news feeds on the Celery worker.
     """
-    service = FeedService(db)
-    background_tasks.add_task(service.refresh_all_feeds)
+    # Publishing to the broker is blocking I/O, keep it off the event loop
+    task = await run_in_threadpool(refresh_all_feeds.delay)
     
-    return {"message": "News feeds refresh started in background"}
+    return {"task_id": task.id, "message": "News feeds refresh queued"}
 
 
 @router.get("/sources")
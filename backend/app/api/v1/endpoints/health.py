@@ -1,36 +1,68 @@
 """
 Health check endpoints for DomainSentry API.
 """
+import asyncio
+import time
 from datetime import datetime
 from typing import Dict
 
-from fastapi import APIRouter
-from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
+from fastapi import APIRouter, Response, status
 from sqlalchemy import text
 
-from fastapi import Depends
-from app.api.deps import get_db
 from app.core.config import settings
+from app.db.session import engine
 
 router = APIRouter()
 
+# Probes hit /health at 1-10 Hz; serve a pre-encoded payload refreshed once per TTL
+HEALTH_CACHE_TTL = 1.0  # seconds
+_health_payload: bytes = b""
+_health_expires_at: float = 0.0
 
-@router.get("/")
-async def health_check() -> Dict:
+# Cap concurrent database probes so probe storms cannot drain the pool
+_db_probe_semaphore = asyncio.Semaphore(2)
+
+
+def _build_health_payload() -> bytes:
     """
-    Basic health check endpoint.
+    Build and encode the basic health payload.
     """
-    return {
+    return orjson.dumps({
         "status": "healthy",
         "service": "domainsentry-backend",
         "version": settings.APP_VERSION,
         "timestamp": datetime.utcnow().isoformat(),
         "environment": settings.ENVIRONMENT
-    }
+    })
+
+
+async def _probe_database() -> None:
+    """
+    Run ``SELECT 1`` on a bare engine connection, outside the session machinery.
+    """
+    async with _db_probe_semaphore:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+
+@router.get("/")
+async def health_check() -> Response:
+    """
+    Basic health check endpoint.
+    """
+    global _health_payload, _health_expires_at
+    
+    now = time.monotonic()
+    if now >= _health_expires_at:
+        _health_payload = _build_health_payload()
+        _health_expires_at = now + HEALTH_CACHE_TTL
+    
+    return Response(content=_health_payload, media_type="application/json")
 
 
 @router.get("/detailed")
-async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict:
+async def detailed_health_check() -> Dict:
     """
     Detailed health check with database connectivity.
     """
@@ -48,7 +80,7 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict:
     
     # Test database connectivity
     try:
-        await db.execute(text("SELECT 1"))
+        await _probe_database()
         health_status["checks"]["database"] = "ok"
     except Exception as e:
         health_status["checks"]["database"] = f"error: {str(e)}"
@@ -58,13 +90,14 @@ async def detailed_health_check(db: AsyncSession = Depends(get_db)) -> Dict:
 
 
 @router.get("/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)) -> Dict:
+async def readiness_check(response: Response) -> Dict:
     """
     Readiness check for container orchestration.
     """
     # Check if we can connect to database
     try:
-        await db.execute(text("SELECT 1"))
+        await _probe_database()
         return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
     except Exception:
-        return {"status": "not_ready", "timestamp": datetime.utcnow().isoformat()}, 503
\ No newline at end of file
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "not_ready", "timestamp": datetime.utcnow().isoformat()}
\ No newline at end of file
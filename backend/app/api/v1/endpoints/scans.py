@@ -2,24 +2,30 @@
 Domain scan endpoints for DomainSentry API.
 """
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.core.pagination import decode_cursor, encode_cursor
 from app.models.domain import DomainScan
 from app.schemas.domain import DomainScanCreate, DomainScanResponse
 from app.services.scan_service import ScanService
 
 router = APIRouter()
 
+# Serializes list bodies directly, skipping FastAPI's response_model pass
+_scan_list_adapter = TypeAdapter(List[DomainScanResponse])
+
 
 @router.get("/", response_model=List[DomainScanResponse])
 async def list_scans(
     db: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     domain_id: uuid.UUID = None,
     scan_type: str = None,
     min_risk_score: float = None,
@@ -27,16 +33,33 @@ async def list_scans(
 ):
     """
     List domain scans with optional filtering.
+    
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch
+    the next page without an OFFSET scan.
     """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
     service = ScanService(db)
-    return await service.list_scans(
+    scans = await service.list_scans(
         skip=skip,
         limit=limit,
         domain_id=domain_id,
         scan_type=scan_type,
         min_risk_score=min_risk_score,
         max_risk_score=max_risk_score,
+        cursor=position,
     )
+    
+    items = _scan_list_adapter.validate_python(scans, from_attributes=True)
+    response = Response(content=_scan_list_adapter.dump_json(items), media_type="application/json")
+    if len(scans) == limit:
+        last = scans[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    return response
 
 
 @router.get("/{scan_id}", response_model=DomainScanResponse)
@@ -71,6 +94,20 @@ async def create_scan(
     return await service.create_scan(scan_data)
 
 
+@router.post("/bulk")
+async def create_scans_bulk(
+    scans_data: List[DomainScanCreate],
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create many domain scans in a single request.
+    """
+    service = ScanService(db)
+    created = await service.create_scans_bulk(scans_data)
+    
+    return {"created": created}
+
+
 @router.get("/by-domain/{domain_id}", response_model=List[DomainScanResponse])
 async def get_scans_by_domain(
     domain_id: uuid.UUID,
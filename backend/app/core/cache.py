@@ -1,13 +1,83 @@
 """
 Redis caching utilities for DomainSentry.
 """
-import json
-import pickle
-from typing import Any, Optional, Union
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import msgspec
+from redis import asyncio as aioredis
 
-import aioredis
 from app.core.config import settings
 
+# Leading byte versions the wire format; entries with another prefix read as misses
+_WIRE_VERSION = b"\x02"
+
+# msgpack extension codes for values msgspec would otherwise encode as strings
+_EXT_NAIVE_DATETIME = 1
+_EXT_UUID = 2
+_EXT_DECIMAL = 3
+
+
+def _ext_hook(code: int, data: memoryview) -> Any:
+    """
+    Rebuild a value stored under one of the cache's extension codes.
+    """
+    if code == _EXT_NAIVE_DATETIME:
+        return datetime.fromisoformat(bytes(data).decode())
+    if code == _EXT_UUID:
+        return uuid.UUID(bytes=bytes(data))
+    if code == _EXT_DECIMAL:
+        return Decimal(bytes(data).decode())
+    return msgspec.msgpack.Ext(code, bytes(data))
+
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(ext_hook=_ext_hook)
+
+# Keys fetched per SCAN step and unlinked per command in clear_pattern
+CLEAR_SCAN_COUNT = 1000
+CLEAR_BATCH_SIZE = 1000
+
+
+def _decode(value: Optional[bytes]) -> Optional[Any]:
+    """
+    Decode a cached payload, treating unknown wire versions as a miss.
+    """
+    if value is None or value[:1] != _WIRE_VERSION:
+        return None
+    return _decoder.decode(memoryview(value)[1:])
+
+
+def _to_wire(value: Any) -> Any:
+    """
+    Swap values msgspec would flatten to strings for extension types.
+    
+    Aware datetimes already round-trip as msgpack timestamps (in UTC). Only
+    dicts, lists, tuples and sets are walked, and the sequences come back as lists.
+    """
+    if isinstance(value, dict):
+        return {key: _to_wire(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_wire(item) for item in value]
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return msgspec.msgpack.Ext(_EXT_NAIVE_DATETIME, value.isoformat().encode())
+        return value
+    if isinstance(value, uuid.UUID):
+        return msgspec.msgpack.Ext(_EXT_UUID, value.bytes)
+    if isinstance(value, Decimal):
+        return msgspec.msgpack.Ext(_EXT_DECIMAL, str(value).encode())
+    return value
+
+
+def _encode(value: Any) -> bytes:
+    """
+    Encode a value for caching, prefixed with the wire version.
+    """
+    return _WIRE_VERSION + _encoder.encode(_to_wire(value))
+
 
 class CacheManager:
     """
@@ -21,10 +91,13 @@ class CacheManager:
         """
         Connect to Redis.
         """
-        self.redis = await aioredis.from_url(
+        self.redis = aioredis.from_url(
             settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=False  # We'll handle encoding manually
+            decode_responses=False,  # Values stay bytes end-to-end for msgspec
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True,
+            retry_on_timeout=True,
         )
     
     async def disconnect(self):
@@ -32,7 +105,8 @@ class CacheManager:
         Disconnect from Redis.
         """
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
+            self.redis = None
     
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -42,18 +116,30 @@ class CacheManager:
             return None
         
         try:
-            value = await self.redis.get(key)
-            if value is not None:
-                # Try to deserialize as JSON first, then as pickle if that fails
-                try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, TypeError):
-                    # If JSON fails, try pickle
-                    return pickle.loads(value)
-            return None
-        except Exception:
+            return _decode(await self.redis.get(key))
+        except (aioredis.RedisError, msgspec.DecodeError):
             return None
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values from cache in one round-trip.
+        """
+        if not self.redis or not keys:
+            return [None] * len(keys)
+        
+        try:
+            values = await self.redis.mget(keys)
+        except aioredis.RedisError:
+            return [None] * len(keys)
+        
+        results = []
+        for value in values:
+            try:
+                results.append(_decode(value))
+            except msgspec.DecodeError:
+                results.append(None)
+        return results
+    
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Set a value in cache.
@@ -62,12 +148,7 @@ class CacheManager:
             return False
         
         try:
-            # Serialize as JSON if possible, otherwise use pickle
-            try:
-                serialized_value = json.dumps(value)
-            except (TypeError, ValueError):
-                # If JSON serialization fails, use pickle
-                serialized_value = pickle.dumps(value)
+            serialized_value = _encode(value)
             
             if ttl is None:
                 ttl = settings.REDIS_CACHE_TTL
@@ -77,6 +158,32 @@ class CacheManager:
         except Exception:
             return False
     
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values in cache with one pipelined round-trip.
+        
+        A value object shared by several keys is encoded once and its buffer
+        written under each of them.
+        """
+        if not self.redis:
+            return False
+        
+        if ttl is None:
+            ttl = settings.REDIS_CACHE_TTL
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            encoded = {}
+            for key, value in items.items():
+                payload = encoded.get(id(value))
+                if payload is None:
+                    payload = encoded[id(value)] = _encode(value)
+                pipe.setex(key, ttl, payload)
+            await pipe.execute()
+            return True
+        except Exception:
+            return False
+    
     async def delete(self, key: str) -> bool:
         """
         Delete a key from cache.
@@ -98,14 +205,26 @@ class CacheManager:
             return 0
         
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                await self.redis.delete(*keys)
-                return len(keys)
-            return 0
+            # SCAN instead of KEYS so large keyspaces don't block Redis
+            deleted = 0
+            batch = []
+            async for key in self.redis.scan_iter(match=pattern, count=CLEAR_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= CLEAR_BATCH_SIZE:
+                    deleted += await self._delete_batch(batch)
+                    batch = []
+            if batch:
+                deleted += await self._delete_batch(batch)
+            return deleted
         except Exception:
             return 0
     
+    async def _delete_batch(self, keys: List[bytes]) -> int:
+        """
+        Delete a batch of keys with one UNLINK, reclaiming memory off the main thread.
+        """
+        return await self.redis.unlink(*keys)
+    
     async def exists(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -161,4 +280,50 @@ async def set_cached_risk_analysis(domain_name: str, risk_data: dict, ttl: int =
     Cache risk analysis.
     """
     key = f"risk:{domain_name}"
-    return await cache.set(key, risk_data, ttl)
\ No newline at end of file
+    return await cache.set(key, risk_data, ttl)
+
+
+async def get_cached_provider_result(provider: str, query: str) -> Optional[dict]:
+    """
+    Get a cached external provider response.
+    """
+    key = f"provider:{provider}:{query}"
+    return await cache.get(key)
+
+
+async def set_cached_provider_result(provider: str, query: str, result: dict, ttl: int) -> bool:
+    """
+    Cache an external provider response.
+    """
+    key = f"provider:{provider}:{query}"
+    return await cache.set(key, result, ttl)
+
+
+# Dashboard aggregates cached by DomainService, dropped on any domain write
+STATS_CACHE_NAMES = ("domain_stats", "risk_distribution")
+
+
+async def get_cached_stats(name: str) -> Optional[dict]:
+    """
+    Get a cached dashboard aggregate.
+    """
+    key = f"stats:{name}"
+    return await cache.get(key)
+
+
+async def set_cached_stats(name: str, stats: dict, ttl: Optional[int] = None) -> bool:
+    """
+    Cache a dashboard aggregate.
+    """
+    key = f"stats:{name}"
+    return await cache.set(key, stats, settings.STATS_CACHE_TTL if ttl is None else ttl)
+
+
+async def invalidate_stats_cache() -> bool:
+    """
+    Drop every cached dashboard aggregate.
+    """
+    deleted = False
+    for name in STATS_CACHE_NAMES:
+        deleted = await cache.delete(f"stats:{name}") or deleted
+    return deleted
\ No newline at end of file
@@ -30,10 +30,19 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./domainsentry.db"
     CREATE_DB_TABLES: bool = True  # Auto-create tables (use False in production)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_PRE_PING: bool = False  # pool_recycle already retires stale connections
+    DB_POOL_RECYCLE: int = 3600  # seconds
+    DB_STATEMENT_CACHE_SIZE: int = 1024  # asyncpg server-side prepared statements
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 512  # SQLAlchemy asyncpg adapter cache
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_TTL: int = 300  # 5 minutes default
+    STATS_CACHE_TTL: int = 60  # dashboard aggregates, invalidated on domain writes
+    REDIS_MAX_CONNECTIONS: int = 64
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # seconds
     
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
@@ -75,27 +84,9 @@ class Settings(BaseSettings):
     RISK_ENGINE_ENABLED: bool = True
     RISK_CONFIG_PATH: str = "config/risk_weights.yaml"
     
-    @field_validator("CORS_ORIGINS", mode="before")
+    @field_validator("CORS_ORIGINS", "ALLOWED_HOSTS", "RSS_FEEDS", mode="before")
     @classmethod
-    def assemble_cors_origins(cls, v: str | List[str]) -> List[str] | str:
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
-            return v
-        raise ValueError(v)
-    
-    @field_validator("ALLOWED_HOSTS", mode="before")
-    @classmethod
-    def assemble_allowed_hosts(cls, v: str | List[str]) -> List[str] | str:
-        if isinstance(v, str) and not v.startswith("["):
-            return [i.strip() for i in v.split(",")]
-        elif isinstance(v, (list, str)):
-            return v
-        raise ValueError(v)
-    
-    @field_validator("RSS_FEEDS", mode="before")
-    @classmethod
-    def assemble_rss_feeds(cls, v: str | List[str]) -> List[str] | str:
+    def assemble_list(cls, v: str | List[str]) -> List[str] | str:
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
         elif isinstance(v, (list, str)):
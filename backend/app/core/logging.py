@@ -1,28 +1,17 @@
 """
 Structured logging configuration for DomainSentry.
 """
-import json
 import logging
 import sys
-from datetime import datetime, timezone
 from typing import Any, Dict
 
+import orjson
 import structlog
 from structlog.processors import JSONRenderer, TimeStamper
 from structlog.stdlib import add_log_level, filter_by_level
 from structlog.threadlocal import wrap_dict
 
 
-def add_timestamp(
-    logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
-) -> Dict[str, Any]:
-    """
-    Add ISO 8601 timestamp to log events.
-    """
-    event_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
-    return event_dict
-
-
 def add_environment(
     logger: logging.Logger, method_name: str, event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -36,6 +25,18 @@ def add_environment(
     return event_dict
 
 
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """
+    JSON serializer for JSONRenderer backed by orjson.
+    
+    Datetimes in event values render as UTC with a ``Z`` suffix, matching
+    the ``timestamp`` field.
+    """
+    return orjson.dumps(
+        obj, default=default, option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC
+    ).decode("utf-8")
+
+
 def configure_logging() -> None:
     """
     Configure structured logging with structlog.
@@ -47,19 +48,27 @@ def configure_logging() -> None:
         level=logging.INFO,
     )
     
+    from app.core.config import settings
+    
+    processors = [
+        filter_by_level,
+        add_log_level,
+        TimeStamper(fmt="iso", utc=True, key="timestamp"),
+        add_environment,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+    ]
+    if settings.DEBUG or settings.ENVIRONMENT != "production":
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors += [
+        # No-op unless the call site passed exc_info
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+        JSONRenderer(serializer=_orjson_dumps),
+    ]
+    
     # Configure structlog
     structlog.configure(
-        processors=[
-            filter_by_level,
-            add_log_level,
-            add_timestamp,
-            add_environment,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            JSONRenderer(),
-        ],
+        processors=processors,
         context_class=wrap_dict(dict),
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -0,0 +1,70 @@
+"""
+Keyset (cursor) pagination helpers for DomainSentry.
+"""
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple, Union
+
+SortValue = Union[datetime, float, str]
+
+# Type tags for sort-value cursors, mapped to their decoders
+_SORT_VALUE_DECODERS = {
+    "t": datetime.fromisoformat,
+    "f": float,
+    "s": str,
+    "n": lambda text: None,
+}
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """
+    Encode a ``(created_at, id)`` position as an opaque URL-safe cursor.
+    """
+    raw = f"{created_at.isoformat()}|{item_id.hex}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_sort_cursor(value: Optional[SortValue], item_id: uuid.UUID) -> str:
+    """
+    Encode a ``(sort value, id)`` position as an opaque URL-safe cursor.
+    """
+    if value is None:
+        tag, text = "n", ""
+    elif isinstance(value, datetime):
+        tag, text = "t", value.isoformat()
+    elif isinstance(value, str):
+        tag, text = "s", value
+    else:
+        tag, text = "f", repr(float(value))
+    raw = f"{tag}|{item_id.hex}|{text}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_sort_cursor(cursor: str) -> Tuple[Optional[SortValue], uuid.UUID]:
+    """
+    Decode a cursor produced by ``encode_sort_cursor``.
+
+    Raises ValueError if the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        tag, item_id, text = raw.split("|", 2)
+        return _SORT_VALUE_DECODERS[tag](text), uuid.UUID(item_id)
+    except (binascii.Error, UnicodeError, ValueError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -4,7 +4,8 @@ Rate limiting middleware for DomainSentry using slowapi.
 from functools import wraps
 from typing import Callable, Optional
 
-from fastapi import Request
+from fastapi import HTTPException, Request, status
+from limits import parse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -40,17 +41,25 @@ def setup_rate_limiter(app):
 def rate_limit(limit: str):
     """
     Decorator to apply rate limiting to routes.
+    
+    Decorated routes must declare a ``request: Request`` parameter.
     """
+    # Parse "N per M seconds" once, not on every request
+    limit_item = parse(limit)
+    
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Extract request from kwargs or args
-            request = kwargs.get("request") or next((arg for arg in args if isinstance(arg, Request)), None)
+            request: Optional[Request] = kwargs.get("request")
             
-            if request:
-                # Apply rate limiting
-                await limiter.hit(limit, request.state.identifier if hasattr(request.state, 'identifier') else get_remote_address(request))
+            if request is not None:
+                identifier = getattr(request.state, "identifier", None) or get_remote_address(request)
+                if not limiter.limiter.hit(limit_item, identifier):
+                    raise HTTPException(
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        detail=f"Rate limit exceeded: {limit}",
+                    )
             
             return await func(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -0,0 +1,32 @@
+"""
+Portable SQL functions for DomainSentry models and queries.
+"""
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import String
+
+
+class last_label(FunctionElement):
+    """
+    Last dot-separated label of a name (``uk`` for ``a.example.co.uk``), or the
+    whole name when it has no dot.
+
+    Deterministic on every backend, so it can back a generated column.
+    """
+    type = String()
+    name = "last_label"
+    inherit_cache = True
+
+
+@compiles(last_label)
+def _last_label_default(element, compiler, **kw):
+    name = compiler.process(element.clauses, **kw)
+    return f"reverse(split_part(reverse({name}), '.', 1))"
+
+
+@compiles(last_label, "sqlite")
+def _last_label_sqlite(element, compiler, **kw):
+    # rtrim strips every non-dot character from the right, leaving the prefix up
+    # to the last dot; removing that prefix leaves the last label
+    name = compiler.process(element.clauses, **kw)
+    return f"replace({name}, rtrim({name}, replace({name}, '.', '')), '')"
@@ -6,13 +6,26 @@ from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
 
+# Engine options shared by every driver
+engine_options = {
+    "echo": settings.DEBUG,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
+# Pool sizing and statement caches only apply to the asyncpg driver
+if settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+    engine_options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    )
+
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+engine = create_async_engine(settings.DATABASE_URL, **engine_options)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -34,7 +47,10 @@ async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            # Services commit their own writes; only flush what is still pending
+            # so read-only requests skip the extra COMMIT round-trip.
+            if session.new or session.dirty or session.deleted:
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -2,19 +2,24 @@
 DomainSentry Backend - FastAPI Application Entry Point
 """
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict
 
+import orjson
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
 
 from app.api.v1.api import api_router
+from app.core.cache import cache
 from app.core.config import settings
 from app.core.logging import configure_logging
 from app.db.session import engine, Base
 from app.metrics.middleware import PrometheusMiddleware
+from app.services.provider_manager import provider_manager
 
 # Configure logging
 configure_logging()
@@ -37,10 +42,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
     
+    # Resolve metric route labels once, now that every route is registered
+    ROUTE_TEMPLATES.update(
+        {id(route): route.path for route in app.router.routes if hasattr(route, "path")}
+    )
+    
+    # Build the shared Redis pool once, before serving requests
+    await cache.connect()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down DomainSentry backend...")
+    await provider_manager.aclose()
+    await cache.disconnect()
     await engine.dispose()
 
 
@@ -52,6 +67,7 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -70,8 +86,9 @@ app.add_middleware(
     allowed_hosts=settings.ALLOWED_HOSTS,
 )
 
-# Add Prometheus middleware for metrics
-app.add_middleware(PrometheusMiddleware)
+# Add Prometheus middleware for metrics; route labels are filled in at startup
+ROUTE_TEMPLATES: Dict[int, str] = {}
+app.add_middleware(PrometheusMiddleware, route_templates=ROUTE_TEMPLATES)
 
 # Add prometheus metrics endpoint
 metrics_app = make_asgi_app()
@@ -81,51 +98,58 @@ app.mount("/metrics", metrics_app)
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+# Static bodies for / and /health, encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to DomainSentry API",
+    "version": "1.0.0",
+    "docs": "/docs" if settings.DEBUG else None,
+    "health": "/health",
+})
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"})
+
+
 @app.get("/")
-async def root() -> dict:
+async def root() -> Response:
     """
     Root endpoint returning API information.
     """
-    return {
-        "message": "Welcome to DomainSentry API",
-        "version": "1.0.0",
-        "docs": "/docs" if settings.DEBUG else None,
-        "health": "/health",
-    }
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring.
     """
-    return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
+    return Response(
+        content=_HEALTH_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "no-store"},
+    )
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next) -> Response:
     """
-    Middleware to log all incoming requests.
+    Middleware to log each request as a single event once it completes.
     """
-    logger.info(
-        f"Request: {request.method} {request.url.path}",
-        extra={
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": dict(request.query_params),
-            "client_host": request.client.host if request.client else None,
-        },
-    )
-    
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
     
     logger.info(
-        f"Response: {request.method} {request.url.path} -> {response.status_code}",
+        f"{request.method} {request.url.path} -> {response.status_code}",
         extra={
             "method": request.method,
             "path": request.url.path,
             "status_code": response.status_code,
+            "duration_ms": round(duration_ms, 2),
+            "client_host": request.client.host if request.client else None,
         },
     )
     
-    return response
\ No newline at end of file
+    return response
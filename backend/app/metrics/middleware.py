@@ -2,11 +2,12 @@
 Prometheus metrics middleware for DomainSentry.
 """
 import time
-from typing import Callable
+from typing import Callable, Dict, Optional, Tuple
 
 from fastapi import Request, Response
 from prometheus_client import Counter, Histogram
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 
 
 # Define Prometheus metrics
@@ -22,36 +23,58 @@ REQUEST_DURATION = Histogram(
     ["method", "endpoint"]
 )
 
+# Bound child metrics, memoized so .labels() only runs once per label set
+_count_children: Dict[Tuple[str, str, int], Counter] = {}
+_duration_children: Dict[Tuple[str, str], Histogram] = {}
+
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     """
     Middleware to collect Prometheus metrics for HTTP requests.
+    
+    ``route_templates`` maps ``id(route)`` to its path template and may be
+    filled in after construction, once all routes are registered.
     """
     
+    def __init__(self, app: ASGIApp, route_templates: Optional[Dict[int, str]] = None):
+        super().__init__(app)
+        self.route_templates = route_templates if route_templates is not None else {}
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Process request
         response = await call_next(request)
         
-        # Calculate duration
-        duration = time.time() - start_time
+        # Calculate duration (integer nanoseconds, converted once for the histogram)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
-        # Extract endpoint from request
-        endpoint = request.url.path
+        # Label by route template, not raw path, to keep cardinality bounded
+        route = request.scope.get("route")
+        endpoint = self.route_templates.get(id(route))
+        if endpoint is None:
+            endpoint = route.path if route is not None else "unmatched"
         method = request.method
         status_code = response.status_code
         
         # Record metrics
-        REQUEST_COUNT.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=status_code
-        ).inc()
+        count_key = (method, endpoint, status_code)
+        counter = _count_children.get(count_key)
+        if counter is None:
+            counter = _count_children[count_key] = REQUEST_COUNT.labels(
+                method=method,
+                endpoint=endpoint,
+                status_code=status_code
+            )
+        counter.inc()
         
-        REQUEST_DURATION.labels(
-            method=method,
-            endpoint=endpoint
-        ).observe(duration)
+        duration_key = (method, endpoint)
+        histogram = _duration_children.get(duration_key)
+        if histogram is None:
+            histogram = _duration_children[duration_key] = REQUEST_DURATION.labels(
+                method=method,
+                endpoint=endpoint
+            )
+        histogram.observe(duration)
         
-        return response
\ No newline at end of file
+        return response
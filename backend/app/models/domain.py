@@ -2,24 +2,40 @@
 Domain models for DomainSentry.
 """
 import uuid
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, Computed, DateTime, Enum, Float, ForeignKey, Integer, String, Text, column, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from app.db.functions import last_label
 from app.db.guid import GUID
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
 
+RISK_LEVELS = ("low", "medium", "high", "critical")
+
+# Native ENUM on PostgreSQL, VARCHAR elsewhere
+RiskLevelType = Enum(*RISK_LEVELS, name="risk_level_t")
+
+# Binary JSONB on PostgreSQL so containment filters can use GIN indexes
+IndexedJSON = JSON().with_variant(JSONB(), "postgresql")
+
+# Native text[] on PostgreSQL, JSON list elsewhere
+StringArray = JSON().with_variant(ARRAY(String(255)), "postgresql")
+
 
 class Domain(Base):
     """
     Domain model representing a monitored domain.
     """
     __tablename__ = "domains"
+    # Load server-generated timestamps back via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     domain_name = Column(String(255), nullable=False, index=True, unique=True)
+    # Stored last label of domain_name, grouped on by the TLD distribution
+    tld = Column(String(255), Computed(last_label(column("domain_name")), persisted=True), index=True)
     registered_date = Column(DateTime, nullable=True)
     expires_date = Column(DateTime, nullable=True)
     updated_date = Column(DateTime, nullable=True)
@@ -30,17 +46,17 @@ class Domain(Base):
     registrant_organization = Column(String(255), nullable=True)
     registrant_country = Column(String(2), nullable=True)
     registrant_email = Column(String(255), nullable=True)
-    name_servers = Column(JSON, nullable=True)
+    name_servers = Column(StringArray, nullable=True)
     
     # Risk scoring
     risk_score = Column(Float, default=0.0, index=True)
-    risk_level = Column(String(50), default="low")  # low, medium, high, critical
-    risk_factors = Column(JSON, nullable=True)  # List of risk factors and weights
+    risk_level = Column(RiskLevelType, default="low")
+    risk_factors = Column(IndexedJSON, nullable=True)  # List of risk factors and weights
     
     # Threat intelligence
     virustotal_reputation = Column(Integer, nullable=True)
     abuseipdb_reputation = Column(Integer, nullable=True)
-    threat_indicators = Column(JSON, nullable=True)
+    threat_indicators = Column(IndexedJSON, nullable=True)
     
     # Certificate information
     certificate_issuer = Column(String(255), nullable=True)
@@ -55,8 +71,8 @@ class Domain(Base):
     notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     enrichments = relationship("DomainEnrichment", back_populates="domain", cascade="all, delete-orphan")
@@ -71,6 +87,8 @@ class DomainEnrichment(Base):
     Domain enrichment data from external sources.
     """
     __tablename__ = "domain_enrichments"
+    # Load server-generated timestamps back via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     domain_id = Column(GUID(), ForeignKey("domains.id"), nullable=False, index=True)
@@ -86,8 +104,8 @@ class DomainEnrichment(Base):
     http_status_code = Column(Integer, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     domain = relationship("Domain", back_populates="enrichments")
@@ -101,6 +119,8 @@ class DomainScan(Base):
     Historical scans of domains for tracking changes.
     """
     __tablename__ = "domain_scans"
+    # Load server-generated timestamps back via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     domain_id = Column(GUID(), ForeignKey("domains.id"), nullable=False, index=True)
@@ -108,11 +128,11 @@ class DomainScan(Base):
     # Scan results
     scan_type = Column(String(50), nullable=False)  # full, quick, risk, etc.
     scan_data = Column(JSON, nullable=False)  # Complete scan results
-    previous_scan_id = Column(GUID(), ForeignKey("domain_scans.id"), nullable=True)
+    previous_scan_id = Column(GUID(), ForeignKey("domain_scans.id"), nullable=True, index=True)
     
     # Risk scoring
     risk_score = Column(Float, nullable=False)
-    risk_level = Column(String(50), nullable=False)
+    risk_level = Column(RiskLevelType, nullable=False)
     risk_factors = Column(JSON, nullable=True)
     
     # Metadata
@@ -120,7 +140,7 @@ class DomainScan(Base):
     scan_duration_ms = Column(Integer, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     domain = relationship("Domain", back_populates="scans")
@@ -2,20 +2,25 @@
 Feed models for DomainSentry.
 """
 import uuid
-from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy import JSON, Column, DateTime, String, Text, func
+from sqlalchemy.dialects.postgresql import ARRAY
 from app.db.guid import GUID
 
 from app.db.session import Base
 
+# Native text[] on PostgreSQL, JSON list elsewhere
+TagArray = JSON().with_variant(ARRAY(Text), "postgresql")
+
 
 class NewsFeedItem(Base):
     """
     News feed item model for cyber security news aggregation.
     """
     __tablename__ = "news_feed_items"
+    # Load server-generated timestamps back via RETURNING on flush
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(GUID(), primary_key=True, default=uuid.uuid4)
     title = Column(String(500), nullable=False)
@@ -24,12 +29,12 @@ class NewsFeedItem(Base):
     source = Column(String(255), nullable=False)
     published_at = Column(DateTime, nullable=True)
     author = Column(String(255), nullable=True)
-    categories = Column(String, nullable=True)  # Storing as JSON string for simplicity
-    tags = Column(String, nullable=True)  # Storing as JSON string for simplicity
+    categories = Column(TagArray, nullable=True)
+    tags = Column(TagArray, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     def __repr__(self) -> str:
         return f"<NewsFeedItem(id={self.id}, title={self.title}, source={self.source})>"
\ No newline at end of file
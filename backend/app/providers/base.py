@@ -1,9 +1,29 @@
 """
 Base provider interface for DomainSentry.
 """
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+# Provider responses are stamped to the second; reuse the formatted string within a second
+_timestamp_second: int = -1
+_timestamp_iso: str = ""
+
+
+def current_timestamp() -> str:
+    """
+    Get the current UTC time in ISO format, refreshed at most once per second.
+    """
+    global _timestamp_second, _timestamp_iso
+    
+    now = int(time.time())
+    if now != _timestamp_second:
+        _timestamp_iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _timestamp_second = now
+    return _timestamp_iso
+
 
 class BaseProvider(ABC):
     """
@@ -13,6 +33,9 @@ class BaseProvider(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.enabled = config.get('enabled', True)
+        # Bounds in-flight upstream requests to respect rate limits; held by
+        # subclasses around the network call only, so cache hits never wait
+        self._semaphore = asyncio.Semaphore(config.get('concurrency', 10))
     
     @abstractmethod
     async def fetch_data(self, domain: str) -> Optional[Dict[str, Any]]:
@@ -28,11 +51,48 @@ class BaseProvider(ABC):
         """
         pass
     
+    async def fetch_many(self, domains: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch data for several domains concurrently, keyed by domain.
+        """
+        # fetch_data bounds its own network calls with the provider semaphore
+        results = await asyncio.gather(
+            *(self.fetch_data(domain) for domain in domains), return_exceptions=True
+        )
+        
+        return {
+            domain: self._error_result(domain, str(result)) if isinstance(result, Exception) else result
+            for domain, result in zip(domains, results)
+        }
+    
     async def is_available(self) -> bool:
         """
         Check if the provider is available.
         """
         return self.enabled
+    
+    def _error_result(self, domain: str, message: str) -> Dict[str, Any]:
+        """
+        Build the error payload returned in place of provider data.
+        """
+        return {
+            'provider': self.get_provider_name(),
+            'domain': domain,
+            'error': message,
+            'timestamp': self._get_current_timestamp()
+        }
+    
+    def _get_current_timestamp(self) -> str:
+        """
+        Get current timestamp in ISO format.
+        """
+        return current_timestamp()
+    
+    async def aclose(self) -> None:
+        """
+        Release resources held by the provider (e.g. HTTP clients).
+        """
+        pass
 
 
 class ProviderResult:
@@ -2,14 +2,96 @@
 crt.sh Certificate Transparency provider for DomainSentry.
 """
 import asyncio
-import json
-from typing import Any, Dict, List, Optional
+import random
+import time
+from contextlib import aclosing
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Type
 
+import aiohttp
 import httpx
+import ijson
+import msgspec
+import numpy as np
+import pandas as pd
 
+from app.core.cache import get_cached_provider_result, set_cached_provider_result
 from app.providers.base import BaseProvider, ProviderResult
 
 
+class CertificateRecord(msgspec.Struct):
+    """
+    Certificate fields kept from each crt.sh record.
+    """
+    id: Optional[int] = None
+    name_value: Optional[str] = None
+    common_name: Optional[str] = None
+    ca: Any = None
+    publisher: Any = None
+    entry_timestamp: Optional[str] = None
+    not_before: Optional[str] = None
+    not_after: Optional[str] = None
+    sha1: Optional[str] = None
+    sha256: Optional[str] = None
+    subject: Optional[str] = None
+    issuer: Optional[str] = None
+    serial_number: Optional[str] = None
+
+
+_CERT_KEYS = CertificateRecord.__struct_fields__
+_CERT_TIME_KEYS = ('entry_timestamp', 'not_before', 'not_after')
+
+
+def _normalize_fields(fields: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """
+    Turn a requested field subset into a canonical, ordered key tuple.
+    """
+    if not fields:
+        return _CERT_KEYS
+    
+    unknown = set(fields) - set(_CERT_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown certificate fields: {', '.join(sorted(unknown))}")
+    return tuple(key for key in _CERT_KEYS if key in fields)
+
+
+@lru_cache(maxsize=None)
+def _record_type(keys: Tuple[str, ...]) -> Type[msgspec.Struct]:
+    """
+    Get a certificate struct type holding only ``keys``.
+    """
+    if keys == _CERT_KEYS:
+        return CertificateRecord
+    
+    annotations = CertificateRecord.__annotations__
+    return msgspec.defstruct(
+        f"CertificateRecord_{'_'.join(keys)}",
+        [(key, annotations[key], None) for key in keys],
+    )
+
+
+class CrtShHTTPError(Exception):
+    """
+    Raised when crt.sh answers with a non-200 status.
+    """
+    
+    def __init__(self, message: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+    
+    @property
+    def retryable(self) -> bool:
+        return self.status == 429 or self.status >= 500
+
+
+class CrtShRateLimitedError(Exception):
+    """
+    Raised while crt.sh is being backed off after a 429 response.
+    """
+    pass
+
+
 class CrtShProvider(BaseProvider):
     """
     Provider for fetching certificate transparency logs from crt.sh.
@@ -20,17 +102,97 @@ class CrtShProvider(BaseProvider):
         self.base_url = config.get('api_url', 'https://crt.sh/')
         self.max_results = config.get('max_results', 100)
         self.timeout = config.get('timeout', 30)
+        # Seconds to stop calling crt.sh after a 429 without a Retry-After header
+        self.rate_limit_cooldown = config.get('rate_limit_cooldown', 60)
+        # Retries for 429/5xx replies, waiting retry_backoff * 2**attempt plus jitter between them
+        self.max_retries = config.get('max_retries', 2)
+        self.retry_backoff = config.get('retry_backoff', 0.5)
+        # CT logs change slowly; serve repeat lookups from cache for this many seconds
+        self.cache_ttl = config.get('cache_ttl', 3600)
+        # 'httpx' (default) or 'aiohttp', whose connector caches DNS lookups
+        self.http_backend = config.get('http_backend', 'httpx')
+        self._client: Optional[httpx.AsyncClient] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._throttled_until = 0.0
+        self._inflight: Dict[Tuple[str, Tuple[str, ...]], asyncio.Future] = {}
     
     def get_provider_name(self) -> str:
         return "crt.sh"
     
-    async def fetch_data(self, domain: str) -> Optional[Dict[str, Any]]:
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        """
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 lets concurrent lookups multiplex over one TLS connection
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared aiohttp session, creating it on first use.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP clients.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def fetch_data(
+        self,
+        domain: str,
+        format: str = 'aos',
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
         Fetch certificate transparency logs for a domain.
+        
+        ``format='soa'`` returns certificates as per-field columns (see ``_to_columns``)
+        instead of a list of records. ``fields`` limits each certificate to a subset of
+        ``_CERT_KEYS`` (e.g. ``{'name_value'}`` for subdomain listing); the other fields
+        are never materialized.
         """
+        if format not in ('aos', 'soa'):
+            raise ValueError(f"Unknown certificate format: {format}")
+        keys = _normalize_fields(fields)
+        
         if not self.enabled:
             return None
         
+        # Concurrent lookups for the same domain and fields share one in-flight request
+        inflight_key = (domain, keys)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_certificates(domain, keys))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+        
+        # Shielded so a cancelled caller does not cancel the lookup for the others
+        result = await asyncio.shield(task)
+        if 'certificates' in result:
+            return self._apply_format(result, format, keys)
+        return result
+    
+    async def _fetch_certificates(self, domain: str, keys: Tuple[str, ...] = _CERT_KEYS) -> Dict[str, Any]:
+        """
+        Fetch certificate records for a domain from cache or crt.sh.
+        """
         try:
             # Construct the URL for crt.sh API
             # Using the JSON format API: https://crt.sh/JSON?q=example.com
@@ -40,88 +202,162 @@ class CrtShProvider(BaseProvider):
                 'limit': self.max_results
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}",
-                    params=params
-                )
-                
-                if response.status_code == 200:
-                    certificates = response.json()
-                    
-                    # Process the certificate data
-                    processed_data = self._process_certificates(certificates, domain)
-                    
-                    return {
-                        'provider': self.get_provider_name(),
-                        'domain': domain,
-                        'certificates': processed_data,
-                        'total_found': len(processed_data),
-                        'timestamp': self._get_current_timestamp()
-                    }
-                else:
-                    return {
-                        'provider': self.get_provider_name(),
-                        'domain': domain,
-                        'error': f"HTTP {response.status_code}: {response.text}",
-                        'timestamp': self._get_current_timestamp()
-                    }
-        
-        except httpx.RequestError as e:
-            return {
-                'provider': self.get_provider_name(),
-                'domain': domain,
-                'error': f"Request error: {str(e)}",
-                'timestamp': self._get_current_timestamp()
-            }
-        except json.JSONDecodeError as e:
-            return {
+            record_type = _record_type(keys)
+            cache_query = f"{domain}|{params['exclude_expired']}|{self.max_results}"
+            if keys != _CERT_KEYS:
+                cache_query += f"|{','.join(keys)}"
+            cached = await get_cached_provider_result(self.get_provider_name(), cache_query)
+            if cached is not None:
+                try:
+                    cached['certificates'] = msgspec.convert(cached['certificates'], List[record_type])
+                    return cached
+                except (KeyError, msgspec.ValidationError):
+                    pass
+            
+            processed_data = await self._stream_certificates(params, limit=self.max_results, keys=keys)
+            
+            result = {
                 'provider': self.get_provider_name(),
                 'domain': domain,
-                'error': f"JSON decode error: {str(e)}",
+                'certificates': processed_data,
+                'total_found': len(processed_data),
                 'timestamp': self._get_current_timestamp()
             }
+            await set_cached_provider_result(self.get_provider_name(), cache_query, result, self.cache_ttl)
+            
+            return result
+        
+        except (CrtShHTTPError, CrtShRateLimitedError) as e:
+            return self._error_result(domain, str(e))
+        except (httpx.RequestError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return self._error_result(domain, f"Request error: {str(e)}")
+        except ijson.JSONError as e:
+            return self._error_result(domain, f"JSON decode error: {str(e)}")
         except Exception as e:
-            return {
-                'provider': self.get_provider_name(),
-                'domain': domain,
-                'error': f"Unexpected error: {str(e)}",
-                'timestamp': self._get_current_timestamp()
-            }
+            return self._error_result(domain, f"Unexpected error: {str(e)}")
     
-    def _process_certificates(self, certificates: List[Dict], domain: str) -> List[Dict]:
+    def _apply_format(
+        self, result: Dict[str, Any], format: str, keys: Tuple[str, ...] = _CERT_KEYS
+    ) -> Dict[str, Any]:
         """
-        Process raw certificate data from crt.sh.
+        Return the result with certificates in the requested layout.
         """
-        processed = []
+        if format == 'soa':
+            return {**result, 'certificates': self._to_columns(result['certificates'], keys)}
+        return result
+    
+    def _to_columns(self, records: List[msgspec.Struct], keys: Tuple[str, ...] = _CERT_KEYS) -> Dict[str, Any]:
+        """
+        Pivot certificate records into one array per field for vectorised filtering.
         
-        for cert in certificates:
-            processed_cert = {
-                'id': cert.get('id'),
-                'name_value': cert.get('name_value'),
-                'common_name': cert.get('common_name'),
-                'ca': cert.get('ca'),
-                'publisher': cert.get('publisher'),
-                'entry_timestamp': cert.get('entry_timestamp'),
-                'not_before': cert.get('not_before'),
-                'not_after': cert.get('not_after'),
-                'sha1': cert.get('sha1'),
-                'sha256': cert.get('sha256'),
-                'subject': cert.get('subject'),
-                'issuer': cert.get('issuer'),
-                'serial_number': cert.get('serial_number'),
-            }
-            
-            processed.append(processed_cert)
+        ``id`` is a nullable Int64 array, timestamps are ``datetime64[ns]`` (NaT when
+        missing or unparseable) and all other fields are object arrays.
+        """
+        columns: Dict[str, Any] = {}
+        for key in keys:
+            values = [getattr(record, key) for record in records]
+            if key == 'id':
+                columns[key] = pd.array(values, dtype='Int64')
+            elif key in _CERT_TIME_KEYS:
+                columns[key] = pd.to_datetime(values, errors='coerce').to_numpy()
+            else:
+                columns[key] = np.asarray(values, dtype=object)
+        return columns
+    
+    async def _stream_certificates(
+        self,
+        params: Dict[str, Any],
+        limit: Optional[int] = None,
+        keys: Tuple[str, ...] = _CERT_KEYS,
+    ) -> List[msgspec.Struct]:
+        """
+        Stream a crt.sh JSON reply into certificate structs holding only ``keys``.
         
-        return processed
+        The body is parsed incrementally as it arrives, so only one raw
+        certificate is held at a time instead of the whole response.
+        429 and 5xx replies are retried with exponential backoff; a 429 that
+        outlasts the retries starts a backoff window for all later lookups.
+        """
+        remaining = self._throttled_until - time.monotonic()
+        if remaining > 0:
+            raise CrtShRateLimitedError(f"Rate limited by crt.sh; retrying in {remaining:.0f}s")
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                # One provider slot per attempt; backoff sleeps don't hold it
+                async with self._semaphore:
+                    return await self._parse_certificates(params, limit, keys)
+            except CrtShHTTPError as e:
+                if not e.retryable or attempt == self.max_retries:
+                    if e.retry_after is not None:
+                        self._throttled_until = time.monotonic() + e.retry_after
+                    raise
+            await asyncio.sleep(self.retry_backoff * 2 ** attempt + random.uniform(0, 0.25))
     
-    def _get_current_timestamp(self) -> str:
+    async def _parse_certificates(
+        self,
+        params: Dict[str, Any],
+        limit: Optional[int],
+        keys: Tuple[str, ...],
+    ) -> List[msgspec.Struct]:
         """
-        Get current timestamp in ISO format.
+        Parse one crt.sh response into certificate structs.
         """
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        record_type = _record_type(keys)
+        processed: List[msgspec.Struct] = []
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, 'item', use_float=True)
+        
+        async with aclosing(self._iter_body(params)) as chunks:
+            async for chunk in chunks:
+                parser.send(chunk)
+                for cert in parsed:
+                    processed.append(record_type(*map(cert.get, keys)))
+                    if limit is not None and len(processed) >= limit:
+                        return processed
+                parsed.clear()
+        
+        parser.close()
+        for cert in parsed:
+            processed.append(record_type(*map(cert.get, keys)))
+        
+        return processed[:limit] if limit is not None else processed
+    
+    async def _iter_body(self, params: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """
+        Yield the crt.sh response body in chunks from the configured HTTP backend.
+        """
+        if self.http_backend == 'aiohttp':
+            session = self._get_session()
+            async with session.get(self.base_url, params=params) as response:
+                if response.status != 200:
+                    self._raise_for_status(response.status, response.headers, await response.text())
+                async for chunk in response.content.iter_any():
+                    yield chunk
+        else:
+            client = self._get_client()
+            async with client.stream('GET', self.base_url, params=params) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._raise_for_status(response.status_code, response.headers, response.text)
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+    
+    def _raise_for_status(self, status: int, headers: Any, body: str) -> None:
+        """
+        Raise for a non-200 reply, noting the requested backoff on 429.
+        """
+        retry_after = self._retry_after(headers) if status == 429 else None
+        raise CrtShHTTPError(f"HTTP {status}: {body}", status, retry_after)
+    
+    def _retry_after(self, headers: Any) -> float:
+        """
+        Get the backoff in seconds requested by a 429 response.
+        """
+        try:
+            return float(headers['Retry-After'])
+        except (KeyError, ValueError):
+            return self.rate_limit_cooldown
     
     async def search_by_fingerprint(self, fingerprint: str) -> Optional[Dict[str, Any]]:
         """
@@ -136,24 +372,18 @@ class CrtShProvider(BaseProvider):
                 'exclude_expired': 'yes'
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}",
-                    params=params
-                )
-                
-                if response.status_code == 200:
-                    certificates = response.json()
-                    processed_data = self._process_certificates(certificates, "")
-                    
-                    return {
-                        'provider': self.get_provider_name(),
-                        'fingerprint': fingerprint,
-                        'certificates': processed_data,
-                        'total_found': len(processed_data),
-                        'timestamp': self._get_current_timestamp()
-                    }
+            processed_data = await self._stream_certificates(params)
+            
+            return {
+                'provider': self.get_provider_name(),
+                'fingerprint': fingerprint,
+                'certificates': processed_data,
+                'total_found': len(processed_data),
+                'timestamp': self._get_current_timestamp()
+            }
         
+        except CrtShHTTPError:
+            return None
         except Exception as e:
             return {
                 'provider': self.get_provider_name(),
@@ -2,10 +2,13 @@
 WhoisXMLAPI provider for DomainSentry.
 """
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
 
+from app.core.cache import get_cached_provider_result, set_cached_provider_result
 from app.providers.base import BaseProvider, ProviderResult
 
 
@@ -14,12 +17,34 @@ class WhoisProvider(BaseProvider):
     Provider for fetching WHOIS data from whoisxmlapi.com.
     """
     
+    # Registrant keys mapped to their flat-schema WHOIS fields
+    _REGISTRANT_FIELDS = {
+        'name': 'registrantName',
+        'organization': 'registrantOrganization',
+        'street': 'registrantStreet',
+        'city': 'registrantCity',
+        'state': 'registrantState',
+        'postal_code': 'registrantZipCode',
+        'country': 'registrantCountry',
+        'email': 'registrantEmail',
+        'telephone': 'registrantTelephone',
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.api_key = config.get('api_key')
         self.mock = config.get('mock', False)
         self.base_url = config.get('api_url', 'https://www.whoisxmlapi.com/whoisserver/WhoisService')
         self.timeout = config.get('timeout', 30)
+        # Query parameters shared by every lookup; only domainName varies per call
+        self._base_params = {'apiKey': self.api_key, 'outputFormat': 'JSON'}
+        # Embedding the raw reply doubles every record's size; only keep it on request
+        self.include_raw = config.get('include_raw', False)
+        # Registration data rarely changes within a day; serve repeat lookups from cache
+        self.cache_ttl = config.get('cache_ttl', 86400)
+        # Live availability probes cost an API call; reuse the last result for this many seconds
+        self.availability_ttl = config.get('availability_ttl', 60)
+        self._avail_cache: Optional[Tuple[float, bool]] = None
         
         # Mock data for development/testing
         self.mock_data = {
@@ -42,9 +67,12 @@ class WhoisProvider(BaseProvider):
     def get_provider_name(self) -> str:
         return "whoisxmlapi.com"
     
-    async def fetch_data(self, domain: str) -> Optional[Dict[str, Any]]:
+    async def fetch_data(self, domain: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """
         Fetch WHOIS data for a domain.
+        
+        ``use_cache=False`` skips the cached result and always queries the API; the
+        fresh reply still replaces the cache entry.
         """
         if not self.enabled:
             return None
@@ -55,66 +83,47 @@ class WhoisProvider(BaseProvider):
         
         # Check if API key is provided
         if not self.api_key:
-            return {
-                'provider': self.get_provider_name(),
-                'domain': domain,
-                'error': 'API key not provided',
-                'timestamp': self._get_current_timestamp()
-            }
+            return self._error_result(domain, 'API key not provided')
         
         try:
-            params = {
-                'apiKey': self.api_key,
-                'domainName': domain,
-                'outputFormat': 'JSON'
-            }
+            params = {**self._base_params, 'domainName': domain}
+            
+            if use_cache:
+                cached = await get_cached_provider_result(self.get_provider_name(), domain)
+                if cached is not None:
+                    return cached
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._semaphore, httpx.AsyncClient(timeout=self.timeout) as client:
                 response = await client.get(self.base_url, params=params)
                 
                 if response.status_code == 200:
-                    whois_data = response.json()
+                    whois_data = orjson.loads(response.content)
                     
                     # Validate response structure
                     if 'ErrorMessage' in whois_data:
-                        return {
-                            'provider': self.get_provider_name(),
-                            'domain': domain,
-                            'error': whois_data['ErrorMessage'],
-                            'timestamp': self._get_current_timestamp()
-                        }
+                        return self._error_result(domain, whois_data['ErrorMessage'])
                     
                     # Process the WHOIS data
                     processed_data = self._process_whois_data(whois_data, domain)
                     
-                    return {
+                    result = {
                         'provider': self.get_provider_name(),
                         'domain': domain,
                         'whois_data': processed_data,
                         'timestamp': self._get_current_timestamp()
                     }
+                    await set_cached_provider_result(self.get_provider_name(), domain, result, self.cache_ttl)
+                    
+                    return result
                 else:
-                    return {
-                        'provider': self.get_provider_name(),
-                        'domain': domain,
-                        'error': f"HTTP {response.status_code}: {response.text}",
-                        'timestamp': self._get_current_timestamp()
-                    }
+                    return self._error_result(domain, f"HTTP {response.status_code}: {response.text}")
         
         except httpx.RequestError as e:
-            return {
-                'provider': self.get_provider_name(),
-                'domain': domain,
-                'error': f"Request error: {str(e)}",
-                'timestamp': self._get_current_timestamp()
-            }
+            return self._error_result(domain, f"Request error: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            return self._error_result(domain, f"JSON decode error: {str(e)}")
         except Exception as e:
-            return {
-                'provider': self.get_provider_name(),
-                'domain': domain,
-                'error': f"Unexpected error: {str(e)}",
-                'timestamp': self._get_current_timestamp()
-            }
+            return self._error_result(domain, f"Unexpected error: {str(e)}")
     
     def _process_whois_data(self, raw_data: Dict, domain: str) -> Dict:
         """
@@ -130,65 +139,38 @@ class WhoisProvider(BaseProvider):
             'name_servers': self._extract_name_servers(raw_data),
             'status': raw_data.get('status', []),
             'dnssec': raw_data.get('dnssec'),
-            'raw_data': raw_data
         }
         
+        if self.include_raw:
+            processed['raw_data'] = raw_data
+        
         return processed
     
     def _extract_registrant(self, raw_data: Dict) -> Dict:
         """
         Extract registrant information from WHOIS data.
         """
-        # Different formats depending on the registry
-        registrant = raw_data.get('registrant', {})
-        
-        if not registrant:
-            # Try alternative structures
-            if 'contact' in raw_data and 'admin' in raw_data['contact']:
-                registrant = raw_data['contact']['admin']
-            elif 'registrarData' in raw_data:
-                registrant = raw_data['registrarData'].get('registrant', {})
-            else:
-                # Fallback to flat structure
-                registrant = {
-                    'name': raw_data.get('registrantName'),
-                    'organization': raw_data.get('registrantOrganization'),
-                    'street': raw_data.get('registrantStreet'),
-                    'city': raw_data.get('registrantCity'),
-                    'state': raw_data.get('registrantState'),
-                    'postal_code': raw_data.get('registrantZipCode'),
-                    'country': raw_data.get('registrantCountry'),
-                    'email': raw_data.get('registrantEmail'),
-                    'telephone': raw_data.get('registrantTelephone')
-                }
-        
-        return registrant
+        # Different formats depending on the registry; flat fields are the last resort
+        return (
+            raw_data.get('registrant')
+            or (raw_data.get('contact') or {}).get('admin')
+            or (raw_data.get('registrarData') or {}).get('registrant')
+            or {key: raw_data.get(field) for key, field in self._REGISTRANT_FIELDS.items()}
+        )
     
     def _extract_name_servers(self, raw_data: Dict) -> List[str]:
         """
         Extract name servers from WHOIS data.
         """
-        name_servers = []
-        
         # Different formats depending on the registry
-        if 'nameServers' in raw_data:
-            ns_data = raw_data['nameServers']
-            if isinstance(ns_data, dict) and 'hostNames' in ns_data:
-                name_servers = ns_data['hostNames']
-            elif isinstance(ns_data, list):
-                name_servers = ns_data
-            else:
-                # Handle flat array
-                name_servers = [ns_data] if isinstance(ns_data, str) else []
-        elif 'nameServer' in raw_data:
-            # Alternative structure
-            ns = raw_data['nameServer']
-            if isinstance(ns, list):
-                name_servers = ns
-            elif isinstance(ns, str):
-                name_servers = [ns]
+        ns_data = raw_data.get('nameServers') or raw_data.get('nameServer') or []
+        if isinstance(ns_data, dict):
+            ns_data = ns_data.get('hostNames') or []
+        elif isinstance(ns_data, str):
+            ns_data = [ns_data]
         
-        return [ns.lower() for ns in name_servers if ns]
+        # Registries often repeat hosts with different casing; dedupe and sort for stable output
+        return sorted({ns.lower() for ns in ns_data if isinstance(ns, str) and ns})
     
     def _get_mock_data(self, domain: str) -> Dict:
         """
@@ -205,13 +187,6 @@ class WhoisProvider(BaseProvider):
             'mocked': True
         }
     
-    def _get_current_timestamp(self) -> str:
-        """
-        Get current timestamp in ISO format.
-        """
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
-    
     async def is_available(self) -> bool:
         """
         Check if the provider is available (and properly configured).
@@ -225,9 +200,15 @@ class WhoisProvider(BaseProvider):
         if not self.api_key:
             return False
         
-        # Perform a simple test with a known domain
+        if self._avail_cache and time.monotonic() - self._avail_cache[0] < self.availability_ttl:
+            return self._avail_cache[1]
+        
+        # Perform a live test with a known domain; a cached reply says nothing about the API now
         try:
-            result = await self.fetch_data('google.com')
-            return result is not None and 'error' not in result
+            result = await self.fetch_data('google.com', use_cache=False)
+            available = result is not None and 'error' not in result
         except:
-            return False
\ No newline at end of file
+            available = False
+        
+        self._avail_cache = (time.monotonic(), available)
+        return available
\ No newline at end of file
@@ -12,19 +12,74 @@ Advanced scoring engine for domain risk assessment using ML-lite techniques:
 Supports configurable weights via YAML and real-time scoring.
 """
 
+import os
 import re
 import math
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
+import ahocorasick
+import orjson
 import yaml
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
 import numpy as np
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
 
+from app.risk_engine_kernels import label_stats_batch_u8, shannon_u8
+
 logger = logging.getLogger(__name__)
 
+# Parsed YAML config is mirrored to this JSON sidecar so later loads skip the YAML parser
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+# Non-ASCII strings at least this long take the numpy entropy path; below it the
+# array setup costs more than a Python loop over the distinct characters
+VECTOR_ENTROPY_MIN_LEN = 256
+
+# Distinct domains whose name-derived component scores are memoized per engine
+DOMAIN_SCORE_CACHE_SIZE = 65536
+
+# Config weight keys (and defaults) in the column order of the weight vector
+COMPONENT_WEIGHT_DEFAULTS = (
+    ("domain_length", 0.15),
+    ("entropy_score", 0.25),
+    ("tld_risk", 0.20),
+    ("keyword_matches", 0.30),
+    ("age_days", 0.10)
+)
+
+# Byte -> 1 for an ASCII consonant, 2 for a vowel, 0 otherwise (either case)
+_CV_LUT = bytes(
+    1 if chr(b).lower() in 'bcdfghjklmnpqrstvwxyz' else 2 if chr(b).lower() in 'aeiou' else 0
+    for b in range(256)
+)
+_CV_CLASSES = np.frombuffer(_CV_LUT, np.uint8)
+
+
+def _consonant_vowel_ratio(name: str) -> float:
+    """Consonants per vowel (+1) in a name, as used by the ML pattern score."""
+    if name.isascii():
+        # translate/count run in C instead of two generator passes
+        classes = name.encode('ascii').translate(_CV_LUT)
+        consonants = classes.count(1)
+        vowels = classes.count(2)
+    else:
+        # Keep str.lower() semantics, which can fold non-ASCII letters to ASCII ones
+        consonants = sum(1 for c in name if c.lower() in 'bcdfghjklmnpqrstvwxyz')
+        vowels = sum(1 for c in name if c.lower() in 'aeiou')
+    return consonants / (vowels + 1)
+
+
+def _split_domain(domain: str) -> Tuple[str, str]:
+    """Return the first label and the ``.tld`` of a domain (the domain itself when dotless)."""
+    _, dot, last = domain.rpartition('.')
+    if not dot:
+        return domain, domain
+    return domain.partition('.')[0], f".{last}"
+
+
+# Per-match weight of each keyword category in the keyword score
+KEYWORD_CATEGORY_WEIGHTS = {"suspicious": 1, "malware": 2, "phishing": 3}
+
 
 class RiskEngine:
     """World-class risk scoring engine for domain names."""
@@ -33,30 +88,74 @@ class RiskEngine:
         """Initialize the risk engine with configuration."""
         self.config = self._load_config(config_path)
         self.weights = self.config.get("weights", {})
+        self._refresh_weight_vec()
         
-        # Load keyword patterns
-        self.suspicious_keywords = self.config.get("suspicious_keywords", [])
-        self.malware_keywords = self.config.get("malware_keywords", [])
-        self.phishing_keywords = self.config.get("phishing_keywords", [])
+        # Load keyword patterns, frozen so the automaton indexes below stay valid
+        self.suspicious_keywords = tuple(self.config.get("suspicious_keywords", ()))
+        self.malware_keywords = tuple(self.config.get("malware_keywords", ()))
+        self.phishing_keywords = tuple(self.config.get("phishing_keywords", ()))
         
         # TLD risk scores
         self.tld_risk_scores = self.config.get("tld_risk_scores", {})
         
-        # Initialize ML components
+        # Lookup copy keyed on lowercase ".suffix"; multi-label suffixes (.co.uk) are matched first
+        self._tld_scores = {
+            f".{str(suffix).lower().lstrip('.')}": risk
+            for suffix, risk in self.tld_risk_scores.items()
+        }
+        self._has_multi_label_tlds = any(suffix.count('.') > 1 for suffix in self._tld_scores)
+        
+        # Single-pass matcher over all keyword lists, plus the lists its indexes refer to
+        self._keywords_by_category = {
+            "suspicious": self.suspicious_keywords,
+            "malware": self.malware_keywords,
+            "phishing": self.phishing_keywords
+        }
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # Per-instance memo so cached entries never outlive (or pin) the engine
+        self._domain_components = lru_cache(maxsize=DOMAIN_SCORE_CACHE_SIZE)(self._score_domain_components)
+        
+        # ML components are built on first use by _ensure_ml_models; scoring is heuristic today
         self.tfidf_vectorizer = None
         self.classifier = None
-        self._init_ml_models()
         
         logger.info(f"Risk Engine initialized with weights: {self.weights}")
     
     def _load_config(self, config_path: str) -> Dict:
-        """Load risk configuration from YAML file."""
+        """Load risk configuration from YAML file, via its JSON sidecar when fresh."""
+        cache_path = config_path + CONFIG_CACHE_SUFFIX
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            yaml_mtime = os.stat(config_path).st_mtime_ns
         except FileNotFoundError:
             logger.warning(f"Risk config not found at {config_path}, using defaults")
             return self._get_default_config()
+        
+        try:
+            if os.stat(cache_path).st_mtime_ns >= yaml_mtime:
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            pass
+        
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        self._write_config_cache(cache_path, config)
+        return config
+    
+    def _write_config_cache(self, cache_path: str, config: Dict):
+        """Best-effort write of the JSON sidecar; read-only deployments just skip it."""
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(config))
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Could not write risk config cache {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
     
     def _get_default_config(self) -> Dict:
         """Return default configuration if config file is missing."""
@@ -89,8 +188,31 @@ class RiskEngine:
             }
         }
     
-    def _init_ml_models(self):
-        """Initialize ML models for advanced pattern recognition."""
+    def _build_keyword_automaton(self) -> Optional[ahocorasick.Automaton]:
+        """Build one Aho-Corasick automaton over every keyword list."""
+        automaton = ahocorasick.Automaton()
+        
+        # Each keyword maps to the (category, list index) pairs it appears at
+        for category, keywords in self._keywords_by_category.items():
+            for index, keyword in enumerate(keywords):
+                if keyword:
+                    entries = automaton.get(keyword, ())
+                    automaton.add_word(keyword, entries + ((category, index),))
+        
+        if len(automaton) == 0:
+            return None
+        
+        automaton.make_automaton()
+        return automaton
+    
+    def _ensure_ml_models(self):
+        """Build the ML models on first use; sklearn is imported here to keep it off the import path."""
+        if self.classifier is not None:
+            return
+        
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        
         # Simple TF-IDF vectorizer for domain name analysis
         self.tfidf_vectorizer = TfidfVectorizer(
             analyzer='char',
@@ -113,23 +235,32 @@ class RiskEngine:
         if not text:
             return 0.0
         
-        # Count character frequencies
-        freq = {}
-        for char in text.lower():
-            freq[char] = freq.get(char, 0) + 1
+        text = text.lower()
+        
+        # ASCII labels (the common case) go through the compiled byte kernel
+        if text.isascii():
+            # The kernel reads the bytes object directly; no intermediate ndarray per call
+            return float(shannon_u8(text.encode('ascii')))
         
-        # Calculate entropy
         length = len(text)
+        if length >= VECTOR_ENTROPY_MIN_LEN:
+            # Count code points and reduce p * log2(p) in numpy rather than per character
+            codes = np.frombuffer(text.encode('utf-32-le'), np.uint32)
+            _, counts = np.unique(codes, return_counts=True)
+            probabilities = counts / length
+            return float(-(probabilities * np.log2(probabilities)).sum())
+        
+        # Otherwise count each distinct character with str.count (a C-level scan)
         entropy = 0.0
-        for count in freq.values():
-            probability = count / length
+        for char in set(text):
+            probability = text.count(char) / length
             entropy -= probability * math.log2(probability)
         
         return entropy
     
-    def score_domain_length(self, domain: str) -> Tuple[float, Dict]:
-        """Score based on domain name length."""
-        domain_name = domain.split('.')[0] if '.' in domain else domain
+    def score_domain_length(self, domain: str, label: Optional[str] = None) -> Tuple[float, Dict]:
+        """Score based on domain name length (``label`` skips re-splitting the domain)."""
+        domain_name = label if label is not None else _split_domain(domain)[0]
         length = len(domain_name)
         
         # Scoring logic: very short or very long domains are suspicious
@@ -154,9 +285,9 @@ class RiskEngine:
         
         return score, details
     
-    def score_entropy(self, domain: str) -> Tuple[float, Dict]:
-        """Score based on character entropy."""
-        domain_name = domain.split('.')[0] if '.' in domain else domain
+    def score_entropy(self, domain: str, label: Optional[str] = None) -> Tuple[float, Dict]:
+        """Score based on character entropy (``label`` skips re-splitting the domain)."""
+        domain_name = label if label is not None else _split_domain(domain)[0]
         entropy = self.calculate_entropy(domain_name)
         
         # Normalize entropy score (0-1 range)
@@ -182,17 +313,13 @@ class RiskEngine:
         
         return score, details
     
-    def score_tld(self, domain: str) -> Tuple[float, Dict]:
-        """Score based on TLD risk classification."""
-        # Extract TLD
-        parts = domain.split('.')
-        if len(parts) < 2:
-            tld = domain
-        else:
-            tld = f".{parts[-1]}"
+    def score_tld(self, domain: str, tld: Optional[str] = None) -> Tuple[float, Dict]:
+        """Score based on TLD risk classification (``tld`` skips re-splitting the domain)."""
+        if tld is None:
+            tld = _split_domain(domain)[1]
         
         # Look up TLD risk score
-        tld_risk = self.tld_risk_scores.get(tld.lower(), 0.5)
+        tld, tld_risk = self._tld_risk(domain, tld)
         
         # Map to score
         if tld_risk > 0.7:
@@ -214,6 +341,17 @@ class RiskEngine:
         
         return score, details
     
+    def _tld_risk(self, domain: str, tld: str) -> Tuple[str, float]:
+        """Return the matched suffix and its risk, preferring a configured two-label suffix."""
+        if self._has_multi_label_tlds:
+            parts = domain.rsplit('.', 2)
+            if len(parts) == 3:
+                suffix = f".{parts[1]}.{parts[2]}"
+                risk = self._tld_scores.get(suffix.lower())
+                if risk is not None:
+                    return suffix, risk
+        return tld, self._tld_scores.get(tld.lower(), 0.5)
+    
     def score_keywords(self, domain: str) -> Tuple[float, Dict]:
         """Score based on suspicious keyword matches."""
         domain_lower = domain.lower()
@@ -224,18 +362,13 @@ class RiskEngine:
             "phishing": []
         }
         
-        # Check for keyword matches
-        for keyword in self.suspicious_keywords:
-            if keyword in domain_lower:
-                matches["suspicious"].append(keyword)
-        
-        for keyword in self.malware_keywords:
-            if keyword in domain_lower:
-                matches["malware"].append(keyword)
+        hits = self._keyword_hits(domain_lower)
         
-        for keyword in self.phishing_keywords:
-            if keyword in domain_lower:
-                matches["phishing"].append(keyword)
+        # Report matches in keyword-list order, as the configured lists define them
+        if hits:
+            keywords_by_category = self._keywords_by_category
+            for category, index in sorted(hits):
+                matches[category].append(keywords_by_category[category][index])
         
         # Calculate score based on matches
         total_matches = (
@@ -266,15 +399,26 @@ class RiskEngine:
         
         return score, details
     
-    def score_age(self, created_date: Optional[datetime] = None) -> Tuple[float, Dict]:
-        """Score based on domain age."""
+    def _keyword_hits(self, domain_lower: str) -> set:
+        """Find every (category, keyword index) match in one pass over the domain."""
+        hits = set()
+        if self._keyword_automaton is not None:
+            for _, entries in self._keyword_automaton.iter(domain_lower):
+                hits.update(entries)
+        return hits
+    
+    def score_age(
+        self,
+        created_date: Optional[datetime] = None,
+        now: Optional[datetime] = None
+    ) -> Tuple[float, Dict]:
+        """Score based on domain age, measured against ``now`` (default: utcnow)."""
         if not created_date:
             score = 0.5  # Unknown age
             reason = "Domain age unknown"
             age_days = None
         else:
-            now = datetime.utcnow()
-            age_days = (now - created_date).days
+            age_days = ((now or datetime.utcnow()) - created_date).days
             
             if age_days < 1:
                 score = 0.9  # Brand new domain
@@ -297,18 +441,16 @@ class RiskEngine:
         
         return score, details
     
-    def score_ml_pattern(self, domain: str) -> Tuple[float, Dict]:
-        """Score using ML pattern recognition."""
+    def score_ml_pattern(self, domain: str, label: Optional[str] = None) -> Tuple[float, Dict]:
+        """Score using ML pattern recognition (``label`` skips re-splitting the domain)."""
         # This is a placeholder for actual ML scoring
         # In production, this would use a trained model
         
         # Simple heuristic for now
-        domain_name = domain.split('.')[0] if '.' in domain else domain
+        domain_name = label if label is not None else _split_domain(domain)[0]
         
         # Check for DGA-like patterns (consecutive consonants/vowels)
-        consonants = sum(1 for c in domain_name if c.lower() in 'bcdfghjklmnpqrstvwxyz')
-        vowels = sum(1 for c in domain_name if c.lower() in 'aeiou')
-        ratio = consonants / (vowels + 1)
+        ratio = _consonant_vowel_ratio(domain_name)
         
         if ratio > 3.0:
             score = 0.8
@@ -328,11 +470,29 @@ class RiskEngine:
         
         return score, details
     
+    def _score_domain_components(self, domain: str) -> Tuple[Tuple[float, Dict], ...]:
+        """
+        Score every component that depends only on the domain name.
+        
+        Memoized per engine via ``self._domain_components``; the returned details
+        dicts are shared between calls and must not be mutated.
+        """
+        label, tld = _split_domain(domain)
+        return (
+            self.score_domain_length(domain, label),
+            self.score_entropy(domain, label),
+            self.score_tld(domain, tld),
+            self.score_keywords(domain),
+            self.score_ml_pattern(domain, label)
+        )
+    
     def calculate_overall_risk(
         self,
         domain: str,
         created_date: Optional[datetime] = None,
-        additional_context: Optional[Dict] = None
+        additional_context: Optional[Dict] = None,
+        now: Optional[datetime] = None,
+        details: bool = True
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive risk score for a domain.
@@ -341,28 +501,31 @@ class RiskEngine:
             domain: Domain name to score
             created_date: Domain creation date (optional)
             additional_context: Additional context for scoring (optional)
+            now: Reference time for age and timestamp (optional, defaults to utcnow)
+            details: Include component breakdown and recommendations; when False
+                only domain, overall_score and risk_level are returned
             
         Returns:
             Dictionary with risk score and detailed breakdown
         """
         logger.info(f"Calculating risk score for domain: {domain}")
         
-        # Calculate individual component scores
-        length_score, length_details = self.score_domain_length(domain)
-        entropy_score, entropy_details = self.score_entropy(domain)
-        tld_score, tld_details = self.score_tld(domain)
-        keyword_score, keyword_details = self.score_keywords(domain)
-        age_score, age_details = self.score_age(created_date)
-        ml_score, ml_details = self.score_ml_pattern(domain)
+        # Calculate individual component scores; name-derived ones are memoized,
+        # age depends on the current time so is always recomputed
+        (
+            (length_score, length_details),
+            (entropy_score, entropy_details),
+            (tld_score, tld_details),
+            (keyword_score, keyword_details),
+            (ml_score, ml_details)
+        ) = self._domain_components(domain)
+        if now is None:
+            now = datetime.utcnow()
+        age_score, age_details = self.score_age(created_date, now)
         
         # Weighted average calculation
-        weighted_scores = [
-            length_score * self.weights.get("domain_length", 0.15),
-            entropy_score * self.weights.get("entropy_score", 0.25),
-            tld_score * self.weights.get("tld_risk", 0.20),
-            keyword_score * self.weights.get("keyword_matches", 0.30),
-            age_score * self.weights.get("age_days", 0.10)
-        ]
+        scores = (length_score, entropy_score, tld_score, keyword_score, age_score)
+        weighted_scores = [score * weight for score, weight in zip(scores, self._weight_values)]
         
         # Include ML score if available
         if ml_score:
@@ -389,6 +552,10 @@ class RiskEngine:
         else:
             risk_level = "VERY_LOW"
         
+        if not details:
+            logger.info(f"Risk calculation complete for {domain}: {risk_level} ({overall_score})")
+            return {"domain": domain, "overall_score": round(overall_score, 4), "risk_level": risk_level}
+        
         # Compile result
         result = {
             "domain": domain,
@@ -421,7 +588,7 @@ class RiskEngine:
                 "details": ml_details
             } if ml_score else None,
             "weights": self.weights,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
         
         # Add recommendations if score is high
@@ -463,7 +630,8 @@ class RiskEngine:
     def batch_score_domains(
         self,
         domains: List[str],
-        created_dates: Optional[List[datetime]] = None
+        created_dates: Optional[List[datetime]] = None,
+        details: bool = True
     ) -> List[Dict]:
         """
         Calculate risk scores for multiple domains efficiently.
@@ -471,22 +639,123 @@ class RiskEngine:
         Args:
             domains: List of domain names
             created_dates: Optional list of creation dates
+            details: Include component breakdowns (see calculate_overall_risk)
             
         Returns:
             List of risk results
         """
         results = []
         
+        # One reference time for the whole batch, shared by ages and timestamps
+        now = datetime.utcnow()
         for i, domain in enumerate(domains):
             created_date = created_dates[i] if created_dates else None
-            result = self.calculate_overall_risk(domain, created_date)
+            result = self.calculate_overall_risk(domain, created_date, now=now, details=details)
             results.append(result)
         
         return results
     
+    def batch_score_domains_vec(
+        self,
+        domains: List[str],
+        created_dates: Optional[List[Optional[datetime]]] = None
+    ) -> np.ndarray:
+        """
+        Calculate overall risk scores for many domains without per-domain result dicts.
+        
+        Gathers the raw per-domain features, then maps them to component scores
+        and combines them with whole-array operations. Scores equal
+        ``calculate_overall_risk(...)["overall_score"]`` before its 4-place rounding.
+        
+        Args:
+            domains: List of domain names
+            created_dates: Optional list of creation dates
+            
+        Returns:
+            Array of overall scores, one per domain
+        """
+        n = len(domains)
+        names, tlds = zip(*map(_split_domain, domains)) if n else ((), ())
+        
+        # Raw features, one pass per domain
+        lengths = np.fromiter((len(name) for name in names), dtype=np.int64, count=n)
+        entropies, ratios = self._batch_label_stats(names)
+        tld_risks = np.fromiter(
+            (
+                self._tld_risk(domain, tld)[1]
+                for domain, tld in zip(domains, tlds)
+            ),
+            dtype=np.float64,
+            count=n
+        )
+        keyword_totals = np.fromiter(
+            (
+                sum(KEYWORD_CATEGORY_WEIGHTS[category] for category, _ in self._keyword_hits(domain.lower()))
+                for domain in domains
+            ),
+            dtype=np.int64,
+            count=n
+        )
+        now = datetime.utcnow()
+        age_days = np.fromiter(
+            (
+                (now - created_date).days if created_date else np.nan
+                for created_date in (created_dates or [None] * n)
+            ),
+            dtype=np.float64,
+            count=n
+        )
+        
+        # Component scores, using the same thresholds as the score_* methods
+        component_scores = np.column_stack([
+            np.select([lengths < 5, lengths > 30, lengths > 20], [0.8, 0.7, 0.4], 0.1),
+            np.select([entropies < 2.0, entropies > 4.5, entropies > 4.0], [0.9, 0.8, 0.3], 0.1),
+            np.select([tld_risks > 0.7, tld_risks > 0.5], [0.9, 0.6], 0.2),
+            np.select([keyword_totals >= 3, keyword_totals >= 2, keyword_totals >= 1], [0.95, 0.75, 0.5], 0.1),
+            np.select([np.isnan(age_days), age_days < 1, age_days < 7, age_days < 30], [0.5, 0.9, 0.7, 0.4], 0.1),
+        ])
+        ml_scores = np.select([ratios > 3.0, ratios > 2.0], [0.8, 0.5], 0.2)
+        
+        # The ML pattern score always applies, taking 15% and scaling the rest.
+        # Columns are accumulated in the same order as calculate_overall_risk so the
+        # scores are bit-identical; a matmul reorders the additions and flips roundings.
+        ml_weight = 0.15
+        weighted = (component_scores * self._weight_vec) * (1 - ml_weight)
+        overall = np.zeros(n)
+        for column in weighted.T:
+            overall += column
+        overall += ml_scores * ml_weight
+        
+        return np.minimum(overall, 0.99)
+    
+    def _batch_label_stats(self, names: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Entropy and consonant/vowel ratio for many labels in one fused compiled pass."""
+        lowered = [name.lower() for name in names]
+        if not all(name.isascii() for name in lowered):
+            n = len(names)
+            return (
+                np.fromiter(map(self.calculate_entropy, lowered), dtype=np.float64, count=n),
+                np.fromiter(map(_consonant_vowel_ratio, names), dtype=np.float64, count=n)
+            )
+        
+        # Pack every name into one byte buffer with slice offsets for the kernel;
+        # the consonant/vowel table is case-insensitive, so lowercased bytes serve both
+        offsets = np.zeros(len(lowered) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in lowered], out=offsets[1:])
+        buf = np.frombuffer(''.join(lowered).encode('ascii'), np.uint8)
+        return label_stats_batch_u8(buf, offsets, _CV_CLASSES)
+    
+    def _refresh_weight_vec(self):
+        """Resolve the component weights once, in COMPONENT_WEIGHT_DEFAULTS order."""
+        self._weight_values = tuple(
+            float(self.weights.get(key, default)) for key, default in COMPONENT_WEIGHT_DEFAULTS
+        )
+        self._weight_vec = np.array(self._weight_values, dtype=np.float64)
+    
     def update_weights(self, new_weights: Dict):
         """Update risk weighting configuration."""
         self.weights.update(new_weights)
+        self._refresh_weight_vec()
         logger.info(f"Risk weights updated: {self.weights}")
     
     def export_config(self) -> Dict:
@@ -501,5 +770,14 @@ class RiskEngine:
         }
 
 
-# Singleton instance for easy import
-risk_engine = RiskEngine()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_risk_engine() -> RiskEngine:
+    """Return the shared engine instance, built on first use."""
+    return RiskEngine()
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the ``risk_engine`` singleton lazily so importing this module stays cheap."""
+    if name == "risk_engine":
+        return get_risk_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,10 +3,16 @@ Domain schemas for DomainSentry API.
 """
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, TypeAdapter
 
+# Columns domain listings may be ordered by
+DomainSortField = Literal["created_at", "risk_score", "domain_name"]
+SortOrder = Literal["asc", "desc"]
+
+# Values of the risk_level_t column type (app.models.domain.RiskLevelType)
+RiskLevel = Literal["low", "medium", "high", "critical"]
 
 # Base schemas
 class DomainBase(BaseModel):
@@ -22,7 +28,7 @@ class DomainBase(BaseModel):
     registrant_email: Optional[str] = None
     name_servers: Optional[List[str]] = None
     risk_score: float = Field(0.0, ge=0.0, le=100.0, description="Risk score (0-100)")
-    risk_level: str = Field("low", description="Risk level: low, medium, high, critical")
+    risk_level: RiskLevel = Field("low", description="Risk level: low, medium, high, critical")
     risk_factors: Optional[Dict[str, float]] = None
     virustotal_reputation: Optional[int] = None
     abuseipdb_reputation: Optional[int] = None
@@ -45,7 +51,7 @@ class DomainCreate(DomainBase):
 class DomainUpdate(BaseModel):
     """Schema for updating a domain."""
     risk_score: Optional[float] = None
-    risk_level: Optional[str] = None
+    risk_level: Optional[RiskLevel] = None
     risk_factors: Optional[Dict[str, float]] = None
     threat_indicators: Optional[List[str]] = None
     is_active: Optional[bool] = None
@@ -55,8 +61,10 @@ class DomainUpdate(BaseModel):
 class DomainInDB(DomainBase):
     """Schema for domain data stored in database."""
     id: uuid.UUID
-    created_at: datetime
-    updated_at: datetime
+    # Nullable columns: rows may be unscored or predate the timestamp defaults
+    risk_score: Optional[float] = Field(None, ge=0.0, le=100.0, description="Risk score (0-100)")
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
     
     class Config:
         from_attributes = True
@@ -67,6 +75,11 @@ class DomainResponse(DomainInDB):
     pass
 
 
+# Validate ORM rows in one pydantic-core call instead of model by model
+DomainResponseAdapter = TypeAdapter(DomainResponse)
+DomainListAdapter = TypeAdapter(List[DomainResponse])
+
+
 # Enrichment schemas
 class DomainEnrichmentBase(BaseModel):
     """Base schema for domain enrichment."""
@@ -105,7 +118,7 @@ class DomainScanBase(BaseModel):
     scan_type: str = Field(..., max_length=50, description="Type of scan")
     scan_data: Dict[str, Any] = Field(..., description="Complete scan results")
     risk_score: float = Field(..., ge=0.0, le=100.0, description="Risk score (0-100)")
-    risk_level: str = Field(..., description="Risk level")
+    risk_level: RiskLevel = Field(..., description="Risk level")
     risk_factors: Optional[Dict[str, float]] = None
     scanner_version: Optional[str] = None
     scan_duration_ms: Optional[int] = None
@@ -137,16 +150,17 @@ class DomainScanResponse(DomainScanInDB):
 class DomainListResponse(BaseModel):
     """Schema for paginated domain list response."""
     items: List[DomainResponse]
-    total: int
+    total: Optional[int]  # None for cursor pages, which skip the count
     page: int
     size: int
-    pages: int
+    pages: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class DomainSearchRequest(BaseModel):
     """Schema for domain search request."""
     query: Optional[str] = None
-    risk_level: Optional[str] = None
+    risk_level: Optional[RiskLevel] = None
     min_risk_score: Optional[float] = None
     max_risk_score: Optional[float] = None
     registrar: Optional[str] = None
@@ -154,21 +168,10 @@ class DomainSearchRequest(BaseModel):
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
     page: int = 1
-    size: int = 20
-    sort_by: str = "created_at"
-    sort_order: str = "desc"
-    
-    @validator('size')
-    def validate_size(cls, v):
-        if v < 1 or v > 100:
-            raise ValueError('size must be between 1 and 100')
-        return v
-    
-    @validator('sort_order')
-    def validate_sort_order(cls, v):
-        if v not in ['asc', 'desc']:
-            raise ValueError('sort_order must be asc or desc')
-        return v
+    size: int = Field(20, ge=1, le=100, description="Page size (1-100)")
+    sort_by: DomainSortField = "created_at"
+    sort_order: SortOrder = "desc"
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page; page is ignored")
 
 
 # Risk analysis schemas
@@ -5,20 +5,163 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, bindparam, delete, func, or_, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from app.models.domain import Domain
+from app.core.cache import get_cached_stats, invalidate_stats_cache, set_cached_stats
+from app.core.pagination import SortValue, encode_sort_cursor
+from app.models.domain import Domain, DomainEnrichment, DomainScan
 from app.schemas.domain import (
     DomainCreate,
+    DomainListAdapter,
     DomainResponse,
     DomainUpdate,
     DomainListResponse,
     DomainSearchRequest,
+    DomainSortField,
+    SortOrder,
+)
+
+# Risk score buckets as (min inclusive, max exclusive, label)
+RISK_BUCKETS = (
+    (0, 20, "0-20"),
+    (20, 40, "20-40"),
+    (40, 60, "40-60"),
+    (60, 80, "60-80"),
+    (80, 101, "80-100"),  # 101 to include 100
+)
+
+# Whitelisted sort columns, resolved once at import
+SORT_COLUMNS = {
+    "created_at": Domain.created_at,
+    "risk_score": Domain.risk_score,
+    "domain_name": Domain.domain_name,
+}
+
+# Python type of each sort column's values, for validating cursor positions
+SORT_VALUE_TYPES = {
+    "created_at": datetime,
+    "risk_score": float,
+    "domain_name": str,
+}
+
+# One prebuilt listing statement per sort shape; filters are appended per
+# call and pagination is bound at execute time. The id tiebreak keeps the
+# order total so keyset cursors resume exactly where a page ended. NULLs
+# sort as the largest values on every backend, as in PostgreSQL's B-tree order
+_LIST_DOMAINS_STMTS = {
+    (sort_by, sort_order): (
+        select(Domain)
+        .order_by(
+            *(
+                (column.desc().nulls_first(), Domain.id.desc())
+                if sort_order == "desc"
+                else (column.asc().nulls_last(), Domain.id.asc())
+            )
+        )
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+    for sort_by, column in SORT_COLUMNS.items()
+    for sort_order in ("asc", "desc")
+}
+_COUNT_DOMAINS_STMT = select(func.count()).select_from(Domain)
+
+# TLD counts over the generated, indexed domains.tld column
+_TLD_DISTRIBUTION_STMT = (
+    select(Domain.tld, func.count().label("count"))
+    .group_by(Domain.tld)
+    .order_by(func.count().desc())
+    .limit(bindparam("limit"))
 )
 
 
+def _registrar_condition(term: str):
+    """
+    Match registrar by substring, or as an anchored LIKE pattern when the term
+    carries its own ``%`` wildcards without a leading one (e.g. ``godaddy%``).
+    
+    The anchored form compares ``lower(registrar)`` so PostgreSQL can use the
+    ``text_pattern_ops`` index from migration 0004 instead of a scan.
+    """
+    if '%' in term and not term.startswith('%'):
+        return func.lower(Domain.registrar).like(term.lower())
+    return Domain.registrar.ilike(f"%{term}%")
+
+
+def _search_conditions(search_request: DomainSearchRequest) -> List:
+    """
+    Build the WHERE clauses for a domain search.
+    """
+    conditions = []
+    
+    # Apply text search
+    if search_request.query:
+        search_term = f"%{search_request.query}%"
+        conditions.append(
+            or_(
+                Domain.domain_name.ilike(search_term),
+                Domain.registrar.ilike(search_term),
+                Domain.registrant_name.ilike(search_term),
+                Domain.registrant_organization.ilike(search_term),
+                Domain.registrant_email.ilike(search_term),
+                Domain.certificate_issuer.ilike(search_term),
+                Domain.certificate_subject.ilike(search_term),
+            )
+        )
+    
+    # Apply filters
+    if search_request.risk_level:
+        conditions.append(Domain.risk_level == search_request.risk_level)
+    
+    if search_request.min_risk_score is not None:
+        conditions.append(Domain.risk_score >= search_request.min_risk_score)
+    
+    if search_request.max_risk_score is not None:
+        conditions.append(Domain.risk_score <= search_request.max_risk_score)
+    
+    if search_request.registrar:
+        conditions.append(_registrar_condition(search_request.registrar))
+    
+    if search_request.country:
+        conditions.append(Domain.registrant_country == search_request.country)
+    
+    if search_request.date_from:
+        conditions.append(Domain.registered_date >= search_request.date_from)
+    
+    if search_request.date_to:
+        conditions.append(Domain.registered_date <= search_request.date_to)
+    
+    return conditions
+
+
+def _keyset_condition(
+    sort_by: DomainSortField,
+    sort_order: SortOrder,
+    cursor: Tuple[Optional[SortValue], uuid.UUID],
+):
+    """
+    Restrict a listing to rows after a ``(sort value, id)`` keyset position.
+    
+    Served by the ``(sort column, id)`` indexes from migration 0006. NULL sort
+    values rank above every other value, matching the listing order, so the
+    row comparison alone can't reach them.
+    """
+    column = SORT_COLUMNS[sort_by]
+    value, item_id = cursor
+    if sort_order == "desc":
+        # NULLs come first: past a NULL position, finish the NULLs then take the rest
+        if value is None:
+            return or_(and_(column.is_(None), Domain.id < item_id), column.is_not(None))
+        return tuple_(column, Domain.id) < cursor
+    # NULLs come last: past a value, every NULL row is still ahead
+    if value is None:
+        return and_(column.is_(None), Domain.id > item_id)
+    return or_(tuple_(column, Domain.id) > cursor, column.is_(None))
+
+
 class DomainService:
     """
     Service for domain-related operations.
@@ -31,176 +174,110 @@ class DomainService:
         self,
         page: int = 1,
         size: int = 20,
-        sort_by: str = "created_at",
-        sort_order: str = "desc",
+        sort_by: DomainSortField = "created_at",
+        sort_order: SortOrder = "desc",
         risk_level: Optional[str] = None,
         min_risk_score: Optional[float] = None,
         max_risk_score: Optional[float] = None,
+        cursor: Optional[Tuple[Optional[SortValue], uuid.UUID]] = None,
     ) -> DomainListResponse:
         """
         List domains with pagination and filtering.
-        """
-        # Build query
-        query = select(Domain)
         
+        ``cursor`` is a ``(sort value, id)`` keyset position from a previous
+        page's ``next_cursor``; when given, ``page`` is ignored and the total
+        is not counted.
+        """
         # Apply filters
+        conditions = []
         if risk_level:
-            query = query.where(Domain.risk_level == risk_level)
-        
+            conditions.append(Domain.risk_level == risk_level)
         if min_risk_score is not None:
-            query = query.where(Domain.risk_score >= min_risk_score)
-        
+            conditions.append(Domain.risk_score >= min_risk_score)
         if max_risk_score is not None:
-            query = query.where(Domain.risk_score <= max_risk_score)
+            conditions.append(Domain.risk_score <= max_risk_score)
         
-        # Apply sorting
-        sort_column = getattr(Domain, sort_by, Domain.created_at)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
+        return await self._list_page(sort_by, sort_order, conditions, page, size, cursor)
+    
+    async def _list_page(
+        self,
+        sort_by: DomainSortField,
+        sort_order: SortOrder,
+        conditions: List,
+        page: int,
+        size: int,
+        cursor: Optional[Tuple[Optional[SortValue], uuid.UUID]],
+    ) -> DomainListResponse:
+        """
+        Fetch one page by OFFSET or keyset cursor and wrap it in a list response.
+        """
+        query = _LIST_DOMAINS_STMTS[(sort_by, sort_order)]
+        if cursor is None:
+            domains, total = await self._fetch_page(query, conditions, (page - 1) * size, size)
+            # Calculate pages
+            pages = (total + size - 1) // size if size > 0 else 0
         else:
-            query = query.order_by(sort_column.asc())
-        
-        # Count total
-        count_query = select(func.count()).select_from(Domain)
-        if risk_level:
-            count_query = count_query.where(Domain.risk_level == risk_level)
-        if min_risk_score is not None:
-            count_query = count_query.where(Domain.risk_score >= min_risk_score)
-        if max_risk_score is not None:
-            count_query = count_query.where(Domain.risk_score <= max_risk_score)
-        
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply pagination
-        offset = (page - 1) * size
-        query = query.offset(offset).limit(size)
-        
-        # Execute query
-        result = await self.db.execute(query)
-        domains = result.scalars().all()
-        
-        # Calculate pages
-        pages = (total + size - 1) // size if size > 0 else 0
+            # Seek past the cursor instead of discarding OFFSET rows; counting
+            # would rescan every match, so cursor pages carry no total
+            query = query.where(*conditions, _keyset_condition(sort_by, sort_order, cursor))
+            result = await self.db.execute(query, {"offset": 0, "limit": size})
+            domains = result.scalars().all()
+            total = pages = None
+        
+        next_cursor = None
+        if len(domains) == size:
+            last = domains[-1]
+            next_cursor = encode_sort_cursor(getattr(last, sort_by), last.id)
         
         return DomainListResponse(
-            items=domains,
+            items=DomainListAdapter.validate_python(domains, from_attributes=True),
             total=total,
             page=page,
             size=size,
             pages=pages,
+            next_cursor=next_cursor,
         )
     
-    async def search_domains(self, search_request: DomainSearchRequest) -> DomainListResponse:
+    async def _fetch_page(self, query, conditions: List, offset: int, limit: int) -> Tuple[List[Domain], int]:
         """
-        Search domains with advanced filters.
-        """
-        # Build query
-        query = select(Domain)
-        
-        # Apply text search
-        if search_request.query:
-            search_term = f"%{search_request.query}%"
-            query = query.where(
-                or_(
-                    Domain.domain_name.ilike(search_term),
-                    Domain.registrar.ilike(search_term),
-                    Domain.registrant_name.ilike(search_term),
-                    Domain.registrant_organization.ilike(search_term),
-                    Domain.registrant_email.ilike(search_term),
-                    Domain.certificate_issuer.ilike(search_term),
-                    Domain.certificate_subject.ilike(search_term),
-                )
-            )
-        
-        # Apply filters
-        if search_request.risk_level:
-            query = query.where(Domain.risk_level == search_request.risk_level)
-        
-        if search_request.min_risk_score is not None:
-            query = query.where(Domain.risk_score >= search_request.min_risk_score)
-        
-        if search_request.max_risk_score is not None:
-            query = query.where(Domain.risk_score <= search_request.max_risk_score)
-        
-        if search_request.registrar:
-            query = query.where(Domain.registrar.ilike(f"%{search_request.registrar}%"))
-        
-        if search_request.country:
-            query = query.where(Domain.registrant_country == search_request.country)
-        
-        if search_request.date_from:
-            query = query.where(Domain.registered_date >= search_request.date_from)
-        
-        if search_request.date_to:
-            query = query.where(Domain.registered_date <= search_request.date_to)
-        
-        # Apply sorting
-        sort_column = getattr(Domain, search_request.sort_by, Domain.created_at)
-        if search_request.sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
-        
-        # Count total
-        count_query = select(func.count()).select_from(Domain)
-        
-        # Apply same filters to count
-        if search_request.query:
-            search_term = f"%{search_request.query}%"
-            count_query = count_query.where(
-                or_(
-                    Domain.domain_name.ilike(search_term),
-                    Domain.registrar.ilike(search_term),
-                    Domain.registrant_name.ilike(search_term),
-                    Domain.registrant_organization.ilike(search_term),
-                    Domain.registrant_email.ilike(search_term),
-                    Domain.certificate_issuer.ilike(search_term),
-                    Domain.certificate_subject.ilike(search_term),
-                )
-            )
-        
-        if search_request.risk_level:
-            count_query = count_query.where(Domain.risk_level == search_request.risk_level)
-        
-        if search_request.min_risk_score is not None:
-            count_query = count_query.where(Domain.risk_score >= search_request.min_risk_score)
-        
-        if search_request.max_risk_score is not None:
-            count_query = count_query.where(Domain.risk_score <= search_request.max_risk_score)
-        
-        if search_request.registrar:
-            count_query = count_query.where(Domain.registrar.ilike(f"%{search_request.registrar}%"))
-        
-        if search_request.country:
-            count_query = count_query.where(Domain.registrant_country == search_request.country)
-        
-        if search_request.date_from:
-            count_query = count_query.where(Domain.registered_date >= search_request.date_from)
-        
-        if search_request.date_to:
-            count_query = count_query.where(Domain.registered_date <= search_request.date_to)
+        Fetch one filtered page and the filtered total in a single round-trip.
         
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply pagination
-        offset = (search_request.page - 1) * search_request.size
-        query = query.offset(offset).limit(search_request.size)
-        
-        # Execute query
-        result = await self.db.execute(query)
-        domains = result.scalars().all()
+        The total rides along each row as ``count(*) OVER ()``; only a page past
+        the end (no rows to carry it) needs a separate COUNT.
+        """
+        if conditions:
+            query = query.where(*conditions)
         
-        # Calculate pages
-        pages = (total + search_request.size - 1) // search_request.size if search_request.size > 0 else 0
+        result = await self.db.execute(
+            query.add_columns(func.count().over().label("total")),
+            {"offset": offset, "limit": limit},
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if offset == 0:
+            return [], 0
+        
+        count_query = _COUNT_DOMAINS_STMT.where(*conditions) if conditions else _COUNT_DOMAINS_STMT
+        return [], (await self.db.execute(count_query)).scalar()
+    
+    async def search_domains(
+        self,
+        search_request: DomainSearchRequest,
+        cursor: Optional[Tuple[Optional[SortValue], uuid.UUID]] = None,
+    ) -> DomainListResponse:
+        """
+        Search domains with advanced filters.
         
-        return DomainListResponse(
-            items=domains,
-            total=total,
-            page=search_request.page,
-            size=search_request.size,
-            pages=pages,
+        ``cursor`` is the decoded ``search_request.cursor``; see ``list_domains``.
+        """
+        return await self._list_page(
+            search_request.sort_by,
+            search_request.sort_order,
+            _search_conditions(search_request),
+            search_request.page,
+            search_request.size,
+            cursor,
         )
     
     async def get_domain(self, domain_id: uuid.UUID) -> Optional[DomainResponse]:
@@ -223,16 +300,19 @@ class DomainService:
         """
         Create a new domain.
         """
-        # Check if domain already exists
-        existing = await self.get_domain_by_name(domain_data.domain_name)
-        if existing:
-            raise ValueError(f"Domain {domain_data.domain_name} already exists")
-        
-        # Create domain
+        # Create domain; the unique domain_name constraint catches duplicates without
+        # a lookup first, and eager_defaults loads server timestamps on insert
         domain = Domain(**domain_data.dict())
         self.db.add(domain)
-        await self.db.commit()
-        await self.db.refresh(domain)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            if await self.get_domain_by_name(domain_data.domain_name):
+                raise ValueError(f"Domain {domain_data.domain_name} already exists")
+            raise
+        
+        await invalidate_stats_cache()
         
         return domain
     
@@ -244,20 +324,25 @@ class DomainService:
         """
         Update a domain.
         """
-        # Get domain
-        domain = await self.get_domain(domain_id)
+        update_data = domain_data.dict(exclude_unset=True)
+        # Nothing to write; don't bump updated_at or drop cached stats
+        if not update_data:
+            return await self.get_domain(domain_id)
+        
+        # Update fields and read the row back in one UPDATE ... RETURNING;
+        # updated_at is set by the column's onupdate
+        query = (
+            update(Domain)
+            .where(Domain.id == domain_id)
+            .values(**update_data)
+            .returning(Domain)
+        )
+        domain = (await self.db.scalars(query)).one_or_none()
         if not domain:
             return None
         
-        # Update fields
-        update_data = domain_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(domain, field, value)
-        
-        domain.updated_at = datetime.utcnow()
-        
         await self.db.commit()
-        await self.db.refresh(domain)
+        await invalidate_stats_cache()
         
         return domain
     
@@ -265,30 +350,44 @@ class DomainService:
         """
         Delete a domain.
         """
-        # Get domain
-        domain = await self.get_domain(domain_id)
-        if not domain:
-            return False
-        
-        # Delete domain
-        await self.db.delete(domain)
+        # Delete children in bulk, mirroring the ORM delete-orphan cascade without
+        # loading the domain or its collections first
+        await self.db.execute(delete(DomainScan).where(DomainScan.domain_id == domain_id))
+        await self.db.execute(delete(DomainEnrichment).where(DomainEnrichment.domain_id == domain_id))
+        result = await self.db.execute(delete(Domain).where(Domain.id == domain_id))
         await self.db.commit()
         
-        return True
+        deleted = result.rowcount > 0
+        if deleted:
+            await invalidate_stats_cache()
+        
+        return deleted
     
     async def get_domain_stats(self) -> Dict:
         """
         Get domain statistics summary.
         """
-        # Total domains
-        total_query = select(func.count(Domain.id))
-        total_result = await self.db.execute(total_query)
-        total = total_result.scalar()
+        cached = await get_cached_stats("domain_stats")
+        if cached is not None:
+            return cached
         
-        # Active domains
-        active_query = select(func.count(Domain.id)).where(Domain.is_active == True)
-        active_result = await self.db.execute(active_query)
-        active = active_result.scalar()
+        today = datetime.utcnow().date()
+        start_of_day = datetime.combine(today, datetime.min.time())
+        end_of_day = datetime.combine(today, datetime.max.time())
+        
+        # Totals, active count, average risk and today's additions in one scan
+        summary_query = select(
+            func.count(Domain.id).label("total"),
+            func.count(Domain.id).filter(Domain.is_active == True).label("active"),
+            func.avg(Domain.risk_score).label("avg_risk_score"),
+            func.count(Domain.id).filter(
+                and_(
+                    Domain.created_at >= start_of_day,
+                    Domain.created_at <= end_of_day,
+                )
+            ).label("today_count"),
+        )
+        summary = (await self.db.execute(summary_query)).one()
         
         # Risk level distribution
         risk_query = select(
@@ -298,58 +397,40 @@ class DomainService:
         risk_result = await self.db.execute(risk_query)
         risk_distribution = {row.risk_level: row.count for row in risk_result}
         
-        # Average risk score
-        avg_risk_query = select(func.avg(Domain.risk_score))
-        avg_risk_result = await self.db.execute(avg_risk_query)
-        avg_risk_score = avg_risk_result.scalar() or 0.0
-        
-        # Domains added today
-        today = datetime.utcnow().date()
-        start_of_day = datetime.combine(today, datetime.min.time())
-        end_of_day = datetime.combine(today, datetime.max.time())
-        
-        today_query = select(func.count(Domain.id)).where(
-            and_(
-                Domain.created_at >= start_of_day,
-                Domain.created_at <= end_of_day,
-            )
-        )
-        today_result = await self.db.execute(today_query)
-        today_count = today_result.scalar()
-        
-        return {
-            "total_domains": total,
-            "active_domains": active,
+        stats = {
+            "total_domains": summary.total,
+            "active_domains": summary.active,
             "risk_distribution": risk_distribution,
-            "average_risk_score": round(avg_risk_score, 2),
-            "domains_added_today": today_count,
+            "average_risk_score": round(summary.avg_risk_score or 0.0, 2),
+            "domains_added_today": summary.today_count,
             "updated_at": datetime.utcnow().isoformat(),
         }
+        await set_cached_stats("domain_stats", stats)
+        
+        return stats
     
     async def get_risk_distribution(self) -> Dict:
         """
         Get risk score distribution across domains.
         """
-        # Create risk buckets
-        buckets = [
-            (0, 20, "0-20"),
-            (20, 40, "20-40"),
-            (40, 60, "40-60"),
-            (60, 80, "60-80"),
-            (80, 101, "80-100"),  # 101 to include 100
-        ]
+        cached = await get_cached_stats("risk_distribution")
+        if cached is not None:
+            return cached
         
-        distribution = {}
-        for min_score, max_score, label in buckets:
-            query = select(func.count(Domain.id)).where(
+        # Every bucket counted in one scan with FILTER aggregates
+        query = select(*(
+            func.count(Domain.id).filter(
                 and_(
                     Domain.risk_score >= min_score,
                     Domain.risk_score < max_score,
                 )
             )
-            result = await self.db.execute(query)
-            count = result.scalar()
-            distribution[label] = count
+            for min_score, max_score, _ in RISK_BUCKETS
+        ))
+        counts = (await self.db.execute(query)).one()
+        
+        distribution = {label: count for (_, _, label), count in zip(RISK_BUCKETS, counts)}
+        await set_cached_stats("risk_distribution", distribution)
         
         return distribution
     
@@ -357,19 +438,7 @@ class DomainService:
         """
         Get TLD (Top-Level Domain) distribution.
         """
-        # Extract TLD from domain name
-        # Simple approach: get everything after last dot
-        tld_expr = func.substring(
-            Domain.domain_name,
-            func.strpos(Domain.domain_name, '.') + 1,
-        )
-        
-        query = select(
-            tld_expr.label("tld"),
-            func.count(Domain.id).label("count"),
-        ).group_by("tld").order_by(func.count(Domain.id).desc()).limit(limit)
-        
-        result = await self.db.execute(query)
+        result = await self.db.execute(_TLD_DISTRIBUTION_STMT, {"limit": limit})
         distribution = [{"tld": row.tld, "count": row.count} for row in result]
         
         return distribution
@@ -382,31 +451,37 @@ class DomainService:
         end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=days - 1)
         
-        # Generate all dates in range
-        date_range = []
-        current_date = start_date
-        while current_date <= end_date:
-            date_range.append(current_date)
-            current_date += timedelta(days=1)
-        
-        # Query for registrations by date
-        timeline = []
-        for date in date_range:
-            start_of_day = datetime.combine(date, datetime.min.time())
-            end_of_day = datetime.combine(date, datetime.max.time())
-            
-            query = select(func.count(Domain.id)).where(
+        # One grouped count over the whole window instead of a query per day
+        day = func.date(Domain.registered_date)
+        query = (
+            select(day.label("day"), func.count(Domain.id).label("domain_count"))
+            .where(
                 and_(
-                    Domain.registered_date >= start_of_day,
-                    Domain.registered_date <= end_of_day,
+                    Domain.registered_date >= datetime.combine(start_date, datetime.min.time()),
+                    Domain.registered_date < datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
                 )
             )
-            result = await self.db.execute(query)
-            count = result.scalar() or 0
-            
+            .group_by(day)
+        )
+        result = await self.db.execute(query)
+        
+        daily = {}
+        for row in result:
+            row_day = row.day
+            if isinstance(row_day, str):
+                row_day = datetime.fromisoformat(row_day)
+            if isinstance(row_day, datetime):
+                row_day = row_day.date()
+            daily[row_day] = int(row.domain_count)
+        
+        # Fill days without registrations with zero
+        timeline = []
+        current_date = start_date
+        while current_date <= end_date:
             timeline.append({
-                "date": date.isoformat(),
-                "count": count,
+                "date": current_date.isoformat(),
+                "count": daily.get(current_date, 0),
             })
+            current_date += timedelta(days=1)
         
         return timeline
\ No newline at end of file
@@ -2,14 +2,60 @@
 Domain enrichment service for business logic operations.
 """
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.domain import DomainEnrichment
 from app.schemas.domain import DomainEnrichmentCreate, DomainEnrichmentResponse
 
+# Maximum rows sent in a single multi-row INSERT
+BULK_INSERT_BATCH_SIZE = 500
+
+# Rows buffered per fetch when streaming enrichments
+STREAM_CHUNK_SIZE = 1000
+
+# Base listing statement built once; filters are appended per call and
+# pagination is bound at execute time so the cache key never changes
+_LIST_ENRICHMENTS_STMT = (
+    select(DomainEnrichment)
+    .order_by(DomainEnrichment.created_at.desc(), DomainEnrichment.id.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
+# Unpaginated variant for iter_enrichments, fetched in STREAM_CHUNK_SIZE batches
+_STREAM_ENRICHMENTS_STMT = (
+    select(DomainEnrichment)
+    .order_by(DomainEnrichment.created_at.desc(), DomainEnrichment.id.desc())
+    .execution_options(yield_per=STREAM_CHUNK_SIZE)
+)
+
+
+def _enrichment_conditions(
+    domain_id: Optional[uuid.UUID],
+    source: Optional[str],
+    enrichment_type: Optional[str],
+    cursor: Optional[Tuple[datetime, uuid.UUID]],
+) -> List:
+    """
+    Build the WHERE clauses for an enrichment listing.
+    """
+    conditions = []
+    if domain_id:
+        conditions.append(DomainEnrichment.domain_id == domain_id)
+    if source:
+        conditions.append(DomainEnrichment.source == source)
+    if enrichment_type:
+        conditions.append(DomainEnrichment.enrichment_type == enrichment_type)
+    if cursor is not None:
+        conditions.append(
+            tuple_(DomainEnrichment.created_at, DomainEnrichment.id) < cursor
+        )
+    return conditions
+
 
 class EnrichmentService:
     """
@@ -26,32 +72,48 @@ class EnrichmentService:
         domain_id: Optional[uuid.UUID] = None,
         source: Optional[str] = None,
         enrichment_type: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> List[DomainEnrichmentResponse]:
         """
         List domain enrichments with optional filtering.
+        
+        ``cursor`` is a ``(created_at, id)`` keyset position; only enrichments
+        after it in ``created_at DESC, id DESC`` order are returned.
         """
-        query = select(DomainEnrichment)
+        query = _LIST_ENRICHMENTS_STMT
         
         # Apply filters
-        conditions = []
-        if domain_id:
-            conditions.append(DomainEnrichment.domain_id == domain_id)
-        if source:
-            conditions.append(DomainEnrichment.source == source)
-        if enrichment_type:
-            conditions.append(DomainEnrichment.enrichment_type == enrichment_type)
-        
+        conditions = _enrichment_conditions(domain_id, source, enrichment_type, cursor)
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Apply pagination
-        query = query.offset(skip).limit(limit).order_by(DomainEnrichment.created_at.desc())
-        
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, {"offset": skip, "limit": limit})
         enrichments = result.scalars().all()
         
         return enrichments
     
+    async def iter_enrichments(
+        self,
+        domain_id: Optional[uuid.UUID] = None,
+        source: Optional[str] = None,
+        enrichment_type: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> AsyncIterator[DomainEnrichment]:
+        """
+        Stream every matching enrichment in ``list_enrichments`` order.
+        
+        Rows arrive from a server-side cursor ``STREAM_CHUNK_SIZE`` at a time,
+        so bulk callers hold one chunk in memory instead of the whole result.
+        """
+        query = _STREAM_ENRICHMENTS_STMT
+        conditions = _enrichment_conditions(domain_id, source, enrichment_type, cursor)
+        if conditions:
+            query = query.where(and_(*conditions))
+        
+        enrichments = await self.db.stream_scalars(query)
+        async for enrichment in enrichments:
+            yield enrichment
+    
     async def get_enrichment(self, enrichment_id: uuid.UUID) -> Optional[DomainEnrichmentResponse]:
         """
         Get a domain enrichment by ID.
@@ -71,6 +133,19 @@ class EnrichmentService:
         
         return enrichment
     
+    async def create_enrichments_bulk(self, enrichments_data: List[DomainEnrichmentCreate]) -> int:
+        """
+        Create many domain enrichments with batched multi-row INSERTs and one commit.
+        """
+        rows = [enrichment_data.dict() for enrichment_data in enrichments_data]
+        
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            await self.db.execute(insert(DomainEnrichment), rows[start:start + BULK_INSERT_BATCH_SIZE])
+        
+        await self.db.commit()
+        
+        return len(rows)
+    
     async def get_enrichments_by_domain(
         self,
         domain_id: uuid.UUID,
@@ -11,12 +11,20 @@ from typing import List, Optional
 from urllib.parse import urlparse
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.feed import NewsFeedItem as NewsFeedItemModel
 from app.schemas.feed import NewsFeedItemCreate, NewsFeedResponse
 
+# Feeds fetched at once by refresh_all_feeds
+FEED_FETCH_CONCURRENCY = 8
+
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING ... RETURNING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
 
 class FeedService:
     """
@@ -61,9 +69,21 @@ class FeedService:
         new_items = 0
         errors = []
         
-        for feed_url in self.feed_urls:
+        # Fetch every feed concurrently (bounded); saves stay sequential on the one session
+        semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+        
+        async def fetch_one(feed_url: str) -> List[dict]:
+            async with semaphore:
+                return await self._fetch_feed(feed_url)
+        
+        fetched = await asyncio.gather(
+            *(fetch_one(feed_url) for feed_url in self.feed_urls), return_exceptions=True
+        )
+        
+        for feed_url, feed_items in zip(self.feed_urls, fetched):
             try:
-                feed_items = await self._fetch_feed(feed_url)
+                if isinstance(feed_items, Exception):
+                    raise feed_items
                 new_count = await self._save_feed_items(feed_items, feed_url)
                 new_items += new_count
                 processed_feeds += 1
@@ -123,6 +143,49 @@ class FeedService:
         """
         Save feed items to database, avoiding duplicates.
         """
+        if not feed_items:
+            return 0
+        
+        insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if insert is None:
+            return await self._save_feed_items_one_by_one(feed_items, feed_source)
+        
+        source = urlparse(feed_source).netloc
+        rows = [
+            {
+                'id': uuid.uuid4(),
+                'title': item_data['title'],
+                'link': item_data['link'],
+                'description': item_data['description'],
+                'source': source,
+                'published_at': item_data['published_at'],
+                'author': item_data['author'],
+                'categories': item_data['categories'],
+                'tags': item_data['tags'],
+            }
+            for item_data in feed_items
+        ]
+        
+        # One statement for the whole feed; the unique link constraint skips items
+        # already stored, and RETURNING yields only the rows actually inserted
+        statement = (
+            insert(NewsFeedItemModel)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=['link'])
+            .returning(NewsFeedItemModel.id)
+        )
+        result = await self.db.execute(statement)
+        new_items_count = len(result.all())
+        
+        if new_items_count > 0:
+            await self.db.commit()
+        
+        return new_items_count
+    
+    async def _save_feed_items_one_by_one(self, feed_items: List[dict], feed_source: str) -> int:
+        """
+        Save feed items with a lookup per item, for dialects without ON CONFLICT.
+        """
         new_items_count = 0
         
         for item_data in feed_items:
@@ -145,8 +208,6 @@ class FeedService:
                     author=item_data['author'],
                     categories=item_data['categories'],
                     tags=item_data['tags'],
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
                 )
                 
                 self.db.add(feed_item)
@@ -168,35 +229,3 @@ class FeedService:
         Close HTTP client.
         """
         await self.http_client.aclose()
-
-
-# Create a simple model for news feed items since I haven't defined it yet
-from sqlalchemy import Column, DateTime, String, Text
-from sqlalchemy import Column, DateTime, String, Text
-from app.db.guid import GUID
-from app.db.session import Base
-
-
-class NewsFeedItem(Base):
-    """
-    News feed item model.
-    """
-    __tablename__ = "news_feed_items"
-    __table_args__ = {'extend_existing': True}
-    
-    id = Column(GUID(), primary_key=True, default=uuid.uuid4)
-    title = Column(String(500), nullable=False)
-    link = Column(String(1000), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    source = Column(String(255), nullable=False)
-    published_at = Column(DateTime, nullable=True)
-    author = Column(String(255), nullable=True)
-    categories = Column(String, nullable=True)  # Storing as JSON string for simplicity
-    tags = Column(String, nullable=True)  # Storing as JSON string for simplicity
-    
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    
-    def __repr__(self) -> str:
-        return f"<NewsFeedItem(id={self.id}, title={self.title}, source={self.source})>"
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 Provider manager service for DomainSentry.
 """
-from typing import Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
 from app.providers import CrtShProvider, WhoisProvider
 from app.providers.base import BaseProvider, ProviderResult
@@ -63,24 +64,18 @@ class ProviderManager:
         """
         Fetch data from all enabled providers for a domain.
         """
-        results = {}
+        enabled = [(name, provider) for name, provider in self.providers.items() if provider.enabled]
         
-        for provider_name, provider in self.providers.items():
-            if provider.enabled:
-                try:
-                    data = await provider.fetch_data(domain)
-                    results[provider_name] = ProviderResult(
-                        success=data is not None and 'error' not in data,
-                        data=data,
-                        error=data.get('error') if data and 'error' in data else None
-                    )
-                except Exception as e:
-                    results[provider_name] = ProviderResult(
-                        success=False,
-                        error=str(e)
-                    )
+        # Providers are independent network calls; run them side by side
+        outcomes = await asyncio.gather(
+            *(provider.fetch_data(domain) for _, provider in enabled), return_exceptions=True
+        )
         
-        return results
+        return {
+            name: ProviderResult(success=False, error=str(outcome))
+            if isinstance(outcome, Exception) else self._to_result(outcome)
+            for (name, _), outcome in zip(enabled, outcomes)
+        }
     
     async def fetch_data(self, provider_name: str, domain: str) -> Optional[ProviderResult]:
         """
@@ -100,18 +95,24 @@ class ProviderManager:
             )
         
         try:
-            data = await provider.fetch_data(domain)
-            return ProviderResult(
-                success=data is not None and 'error' not in data,
-                data=data,
-                error=data.get('error') if data and 'error' in data else None
-            )
+            return self._to_result(await provider.fetch_data(domain))
         except Exception as e:
             return ProviderResult(
                 success=False,
                 error=str(e)
             )
     
+    @staticmethod
+    def _to_result(data: Optional[Dict[str, Any]]) -> ProviderResult:
+        """
+        Wrap a provider payload, treating an ``error`` key as failure.
+        """
+        return ProviderResult(
+            success=data is not None and 'error' not in data,
+            data=data,
+            error=data.get('error') if data and 'error' in data else None
+        )
+    
     def get_enabled_providers(self) -> List[str]:
         """
         Get list of enabled providers.
@@ -124,6 +125,13 @@ class ProviderManager:
         """
         return {name: provider.enabled for name, provider in self.providers.items()}
     
+    async def aclose(self) -> None:
+        """
+        Release resources held by all providers.
+        """
+        for provider in self.providers.values():
+            await provider.aclose()
+    
     async def test_provider(self, provider_name: str) -> bool:
         """
         Test if a provider is working correctly.
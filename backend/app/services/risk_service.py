@@ -14,13 +14,25 @@ import pandas as pd
 from scipy.stats import entropy
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.naive_bayes import MultinomialNB
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import invalidate_stats_cache
 from app.core.config import settings
 from app.models.domain import Domain, DomainScan
 from app.schemas.domain import RiskAnalysisRequest, RiskAnalysisResponse
 
+# Daily risk aggregates, created by migrations 0002/0007 (PostgreSQL only)
+RISK_TRENDS_VIEW = "mv_risk_trends_daily"
+
+# The view is absent when tables come from create_all rather than Alembic
+_RISK_TRENDS_VIEW_EXISTS_STMT = text("SELECT to_regclass(:name) IS NOT NULL").bindparams(
+    name=RISK_TRENDS_VIEW
+)
+
+# Common TLDs scored as low risk
+SAFE_TLDS = frozenset({".com", ".net", ".org", ".edu", ".gov"})
+
 
 class RiskService:
     """
@@ -30,6 +42,10 @@ class RiskService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.config = self._load_risk_config()
+        
+        # Lookup forms of the config lists, built once rather than per domain
+        self._suspicious_tlds = frozenset(tld.lower() for tld in self.config["suspicious_tlds"])
+        self._high_risk_keywords = tuple(self.config["high_risk_keywords"])
     
     def _load_risk_config(self) -> Dict:
         """
@@ -72,9 +88,9 @@ class RiskService:
         domain.risk_score = risk_score
         domain.risk_level = self._get_risk_level(risk_score)
         domain.risk_factors = risk_factors
-        domain.updated_at = datetime.utcnow()
         
         await self.db.commit()
+        await invalidate_stats_cache()
         await self.db.refresh(domain)
         
         # Create scan record
@@ -124,6 +140,7 @@ class RiskService:
             )
             self.db.add(domain)
             await self.db.commit()
+            await invalidate_stats_cache()
             await self.db.refresh(domain)
         
         return domain
@@ -247,9 +264,9 @@ class RiskService:
         """
         tld = self._get_tld(domain_name).lower()
         
-        if tld in [susp_tld.lower() for susp_tld in self.config["suspicious_tlds"]]:
+        if tld in self._suspicious_tlds:
             return 0.9  # High risk
-        elif tld in [".com", ".net", ".org", ".edu", ".gov"]:
+        elif tld in SAFE_TLDS:
             return 0.1  # Low risk
         else:
             return 0.4  # Medium risk
@@ -258,12 +275,7 @@ class RiskService:
         """
         Calculate risk based on suspicious keywords in domain.
         """
-        domain_lower = domain_name.lower()
-        matching_keywords = []
-        
-        for keyword in self.config["high_risk_keywords"]:
-            if keyword in domain_lower:
-                matching_keywords.append(keyword)
+        matching_keywords = self._find_matching_keywords(domain_name)
         
         if len(matching_keywords) == 0:
             return 0.1  # Low risk
@@ -288,13 +300,7 @@ class RiskService:
         Find matching high-risk keywords in domain name.
         """
         domain_lower = domain_name.lower()
-        matching_keywords = []
-        
-        for keyword in self.config["high_risk_keywords"]:
-            if keyword in domain_lower:
-                matching_keywords.append(keyword)
-        
-        return matching_keywords
+        return [keyword for keyword in self._high_risk_keywords if keyword in domain_lower]
     
     def _get_risk_level(self, risk_score: float) -> str:
         """
@@ -329,7 +335,7 @@ class RiskService:
         
         # TLD-based recommendations
         tld_factor = risk_factors.get("tld_risk", {})
-        if tld_factor.get("raw_value", "") in [susp_tld.lower() for susp_tld in self.config["suspicious_tlds"]]:
+        if tld_factor.get("raw_value", "") in self._suspicious_tlds:
             recommendations.append(f"Suspicious TLD {tld_factor['raw_value']} commonly used for malicious purposes")
         
         # Keyword-based recommendations
@@ -386,42 +392,56 @@ class RiskService:
         """
         end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=days)
-        
-        # Query for average risk scores over time
-        date_range = []
-        current_date = start_date
-        while current_date <= end_date:
-            date_range.append(current_date)
-            current_date += timedelta(days=1)
-        
-        trends = []
-        for date in date_range:
-            start_of_day = datetime.combine(date, datetime.min.time())
-            end_of_day = datetime.combine(date, datetime.max.time())
-            
-            query = select(func.avg(Domain.risk_score)).where(
-                and_(
-                    Domain.created_at >= start_of_day,
-                    Domain.created_at <= end_of_day,
+        since = datetime.combine(start_date, datetime.min.time())
+        
+        if await self._has_risk_trends_view():
+            # Read the precomputed daily aggregates instead of scanning domains
+            query = text(
+                f"SELECT day, sum(domain_count) AS domain_count, "
+                f"sum(scored_count) AS scored_count, "
+                f"sum(risk_score_sum) AS risk_score_sum "
+                f"FROM {RISK_TRENDS_VIEW} WHERE day >= :since GROUP BY day"
+            )
+            result = await self.db.execute(query, {"since": since})
+        else:
+            day = func.date(Domain.created_at)
+            query = (
+                select(
+                    day.label("day"),
+                    func.count(Domain.id).label("domain_count"),
+                    func.count(Domain.risk_score).label("scored_count"),
+                    func.sum(Domain.risk_score).label("risk_score_sum"),
                 )
+                .where(Domain.created_at >= since)
+                .group_by(day)
             )
             result = await self.db.execute(query)
-            avg_risk = result.scalar() or 0.0
-            
-            query_count = select(func.count(Domain.id)).where(
-                and_(
-                    Domain.created_at >= start_of_day,
-                    Domain.created_at <= end_of_day,
-                )
+        
+        daily = {}
+        for row in result:
+            row_day = row.day
+            if isinstance(row_day, str):
+                row_day = datetime.fromisoformat(row_day)
+            if isinstance(row_day, datetime):
+                row_day = row_day.date()
+            daily[row_day] = (
+                int(row.domain_count),
+                int(row.scored_count or 0),
+                float(row.risk_score_sum or 0.0),
             )
-            count_result = await self.db.execute(query_count)
-            count = count_result.scalar() or 0
-            
+        
+        trends = []
+        current_date = start_date
+        while current_date <= end_date:
+            count, scored, score_sum = daily.get(current_date, (0, 0, 0.0))
+            # Unscored domains count toward the total but not the average
+            avg_risk = score_sum / scored if scored else 0.0
             trends.append({
-                "date": date.isoformat(),
+                "date": current_date.isoformat(),
                 "avg_risk_score": round(avg_risk, 2),
                 "domain_count": count
             })
+            current_date += timedelta(days=1)
         
         return {
             "period_days": days,
@@ -429,6 +449,24 @@ class RiskService:
             "updated_at": datetime.utcnow().isoformat()
         }
     
+    async def refresh_risk_trends(self) -> None:
+        """
+        Refresh the precomputed risk trends view.
+        """
+        if not await self._has_risk_trends_view():
+            return
+        
+        await self.db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {RISK_TRENDS_VIEW}"))
+        await self.db.commit()
+    
+    async def _has_risk_trends_view(self) -> bool:
+        """
+        Whether the risk trends materialized view is available.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return False
+        return bool((await self.db.execute(_RISK_TRENDS_VIEW_EXISTS_STMT)).scalar())
+    
     async def get_risk_factor_breakdown(self, days: int = 30) -> Dict:
         """
         Get risk factor breakdown over time.
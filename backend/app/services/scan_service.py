@@ -2,14 +2,27 @@
 Domain scan service for business logic operations.
 """
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.domain import DomainScan
 from app.schemas.domain import DomainScanCreate, DomainScanResponse
 
+# Maximum rows sent in a single multi-row INSERT
+BULK_INSERT_BATCH_SIZE = 500
+
+# Base listing statement built once; filters are appended per call and
+# pagination is bound at execute time so the cache key never changes
+_LIST_SCANS_STMT = (
+    select(DomainScan)
+    .order_by(DomainScan.created_at.desc(), DomainScan.id.desc())
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
 
 class ScanService:
     """
@@ -27,11 +40,15 @@ class ScanService:
         scan_type: Optional[str] = None,
         min_risk_score: Optional[float] = None,
         max_risk_score: Optional[float] = None,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> List[DomainScanResponse]:
         """
         List domain scans with optional filtering.
+        
+        ``cursor`` is a ``(created_at, id)`` keyset position; only scans after
+        it in ``created_at DESC, id DESC`` order are returned.
         """
-        query = select(DomainScan)
+        query = _LIST_SCANS_STMT
         
         # Apply filters
         conditions = []
@@ -43,14 +60,13 @@ class ScanService:
             conditions.append(DomainScan.risk_score >= min_risk_score)
         if max_risk_score is not None:
             conditions.append(DomainScan.risk_score <= max_risk_score)
+        if cursor is not None:
+            conditions.append(tuple_(DomainScan.created_at, DomainScan.id) < cursor)
         
         if conditions:
             query = query.where(and_(*conditions))
         
-        # Apply pagination
-        query = query.offset(skip).limit(limit).order_by(DomainScan.created_at.desc())
-        
-        result = await self.db.execute(query)
+        result = await self.db.execute(query, {"offset": skip, "limit": limit})
         scans = result.scalars().all()
         
         return scans
@@ -74,6 +90,19 @@ class ScanService:
         
         return scan
     
+    async def create_scans_bulk(self, scans_data: List[DomainScanCreate]) -> int:
+        """
+        Create many domain scans with batched multi-row INSERTs and one commit.
+        """
+        rows = [scan_data.dict() for scan_data in scans_data]
+        
+        for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+            await self.db.execute(insert(DomainScan), rows[start:start + BULK_INSERT_BATCH_SIZE])
+        
+        await self.db.commit()
+        
+        return len(rows)
+    
     async def get_scans_by_domain(
         self,
         domain_id: uuid.UUID,
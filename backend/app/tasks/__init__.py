@@ -0,0 +1,3 @@
+"""
+Background task package for DomainSentry.
+"""
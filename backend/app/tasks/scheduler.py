@@ -0,0 +1,13 @@
+"""
+Celery beat schedule for DomainSentry periodic jobs.
+
+Run with: celery -A app.tasks.scheduler beat --loglevel=info
+"""
+from app.tasks.worker import celery_app
+
+celery_app.conf.beat_schedule = {
+    "refresh-risk-trends": {
+        "task": "refresh_risk_trends",
+        "schedule": 300.0,
+    },
+}
@@ -0,0 +1,76 @@
+"""
+Celery worker for DomainSentry background jobs.
+
+Run with: celery -A app.tasks.worker worker --loglevel=info
+"""
+import asyncio
+from typing import Dict
+
+import uvloop
+from celery import Celery
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, engine
+from app.services.feed_service import FeedService
+from app.services.risk_service import RiskService
+
+# Tasks drive provider and database I/O through asyncio.run(); run those loops on uvloop.
+# The API process already gets uvloop from uvicorn's default loop="auto".
+asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+celery_app = Celery(
+    "domainsentry",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND,
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    timezone="UTC",
+    enable_utc=True,
+)
+
+
+async def _refresh_all_feeds() -> Dict:
+    """
+    Refresh all news feeds with a dedicated database session.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            service = FeedService(session)
+            try:
+                return await service.refresh_all_feeds()
+            finally:
+                await service.close()
+    finally:
+        # Pooled connections are bound to this task's event loop
+        await engine.dispose()
+
+
+@celery_app.task(name="refresh_all_feeds")
+def refresh_all_feeds() -> Dict:
+    """
+    Refresh all configured RSS feeds outside the API process.
+    """
+    return asyncio.run(_refresh_all_feeds())
+
+
+async def _refresh_risk_trends() -> None:
+    """
+    Refresh the risk trends materialized view.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await RiskService(session).refresh_risk_trends()
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name="refresh_risk_trends")
+def refresh_risk_trends() -> None:
+    """
+    Recompute the daily risk aggregates behind /risk/trends.
+    """
+    asyncio.run(_refresh_risk_trends())
@@ -0,0 +1,33 @@
+"""
+Tests for cache value serialization.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from app.core.cache import _decode, _encode
+
+
+class TestCacheEncoding:
+    """Test that cached values come back with their original types."""
+
+    def test_round_trip_keeps_types(self):
+        """Naive and aware datetimes, UUIDs and Decimals decode to the same values."""
+        value = {
+            "created_at": datetime(2024, 1, 27, 21, 0, 0, 123456),
+            "checked_at": datetime(2024, 1, 27, 21, 0, tzinfo=timezone.utc),
+            "id": uuid.uuid4(),
+            "score": Decimal("42.50"),
+            "records": [{"expires": datetime(2025, 1, 1)}, "text", 3],
+        }
+
+        assert _decode(_encode(value)) == value
+
+    def test_tuples_come_back_as_lists(self):
+        """Sequences are stored as msgpack arrays."""
+        assert _decode(_encode(("a", datetime(2024, 1, 1)))) == ["a", datetime(2024, 1, 1)]
+
+    def test_unknown_wire_version_is_a_miss(self):
+        """Entries written in another wire format read as None."""
+        assert _decode(b"\x01" + _encode("value")[1:]) is None
@@ -0,0 +1,128 @@
+"""
+Tests for DomainService listing and keyset pagination.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.pagination import decode_sort_cursor
+from app.db.session import Base
+from app.models.domain import Domain
+from app.schemas.domain import DomainUpdate
+from app.services.domain_service import DomainService
+
+PAGE_SIZE = 3
+
+
+@pytest_asyncio.fixture
+async def session():
+    """Async session over a fresh in-memory database seeded with ties and NULLs."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    # Few distinct values, so most rows tie on the sort column
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "domain_name": f"domain{i:02d}.com",
+            "risk_score": float(i % 2) * 50.0,
+            "created_at": datetime(2024, 1, 1 + i % 2),
+        }
+        for i in range(11)
+    ]
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        await db.execute(insert(Domain), rows)
+        # Inserts fill NULLs from column defaults, so clear some values afterwards
+        unscored = [row["id"] for i, row in enumerate(rows) if i % 3 == 0]
+        undated = [row["id"] for i, row in enumerate(rows) if i % 4 == 0]
+        await db.execute(update(Domain).where(Domain.id.in_(unscored)).values(risk_score=None))
+        await db.execute(update(Domain).where(Domain.id.in_(undated)).values(created_at=None))
+        await db.commit()
+        yield db
+
+    await engine.dispose()
+
+
+class TestDomainKeysetPagination:
+    """Test cursor pages against the offset listing."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("sort_by", ["created_at", "risk_score", "domain_name"])
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    async def test_cursor_pages_cover_every_row_once(self, session, sort_by, sort_order):
+        """Following next_cursor visits every row, ties and NULLs included, in listing order."""
+        service = DomainService(session)
+        expected = await service.list_domains(size=100, sort_by=sort_by, sort_order=sort_order)
+
+        page = await service.list_domains(size=PAGE_SIZE, sort_by=sort_by, sort_order=sort_order)
+        seen = [item.id for item in page.items]
+        while page.next_cursor:
+            page = await service.list_domains(
+                size=PAGE_SIZE,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                cursor=decode_sort_cursor(page.next_cursor),
+            )
+            assert page.total is None
+            seen.extend(item.id for item in page.items)
+
+        assert expected.total == 11
+        assert seen == [item.id for item in expected.items]
+
+    @pytest.mark.asyncio
+    async def test_nulls_sort_last_ascending(self, session):
+        """Unscored domains come after every scored one in ascending order."""
+        service = DomainService(session)
+
+        result = await service.list_domains(size=100, sort_by="risk_score", sort_order="asc")
+        scores = [item.risk_score for item in result.items]
+
+        assert scores[-4:] == [None] * 4
+        assert None not in scores[:-4]
+
+
+class TestDomainUpdate:
+    """Test partial domain updates."""
+
+    STALE = datetime(2024, 1, 1)
+
+    async def _stale_domain(self, session):
+        """First listed domain, with updated_at pushed into the past."""
+        domain_id = (await DomainService(session).list_domains(size=1)).items[0].id
+        await session.execute(update(Domain).where(Domain.id == domain_id).values(updated_at=self.STALE))
+        await session.commit()
+        return domain_id
+
+    @pytest.mark.asyncio
+    async def test_update_writes_fields(self, session):
+        """Set fields are written and updated_at is refreshed by the column default."""
+        domain_id = await self._stale_domain(session)
+
+        updated = await DomainService(session).update_domain(domain_id, DomainUpdate(notes="reviewed"))
+
+        assert updated.id == domain_id
+        assert updated.notes == "reviewed"
+        assert updated.updated_at != self.STALE
+
+    @pytest.mark.asyncio
+    async def test_empty_update_leaves_row_untouched(self, session):
+        """An update with no fields set returns the row without bumping updated_at."""
+        domain_id = await self._stale_domain(session)
+
+        unchanged = await DomainService(session).update_domain(domain_id, DomainUpdate())
+
+        assert unchanged.id == domain_id
+        assert unchanged.updated_at == self.STALE
+
+    @pytest.mark.asyncio
+    async def test_empty_update_of_missing_domain(self, session):
+        """A no-op update still reports a missing domain."""
+        service = DomainService(session)
+        assert await service.update_domain(uuid.uuid4(), DomainUpdate()) is None
@@ -0,0 +1,57 @@
+"""
+Tests for keyset pagination cursors.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.core.pagination import decode_cursor, decode_sort_cursor, encode_cursor, encode_sort_cursor
+
+
+class TestCursor:
+    """Test cursor encoding and decoding."""
+
+    def test_round_trip(self):
+        """A cursor decodes back to the position it was built from."""
+        created_at = datetime(2024, 1, 27, 21, 0, 0, 123456)
+        item_id = uuid.uuid4()
+
+        cursor = encode_cursor(created_at, item_id)
+
+        assert decode_cursor(cursor) == (created_at, item_id)
+
+    def test_cursor_is_url_safe(self):
+        """Cursors can be passed as query parameters unescaped."""
+        cursor = encode_cursor(datetime.utcnow(), uuid.uuid4())
+        assert all(c.isalnum() or c in "-_=" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "", "Zm9v"])
+    def test_invalid_cursor(self, cursor):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+class TestSortCursor:
+    """Test sort-value cursor encoding and decoding."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime(2024, 3, 9, 12, 0, 0, 5), 42.5, "example|with-pipe.com", None],
+    )
+    def test_round_trip_keeps_type(self, value):
+        """Each sort value decodes back with its original type."""
+        item_id = uuid.uuid4()
+
+        position = decode_sort_cursor(encode_sort_cursor(value, item_id))
+
+        assert position == (value, item_id)
+        assert type(position[0]) is type(value)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "", "eHx5fHo="])
+    def test_invalid_cursor(self, cursor):
+        """Malformed cursors and unknown type tags raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_sort_cursor(cursor)
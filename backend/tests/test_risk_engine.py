@@ -11,6 +11,10 @@ Covers:
 - Overall risk calculation
 """
 
+import os
+import subprocess
+import sys
+
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
@@ -18,6 +22,8 @@ import numpy as np
 
 from app.risk_engine import RiskEngine, risk_engine
 
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 class TestRiskEngine:
     """Test suite for the RiskEngine class."""
@@ -248,6 +254,60 @@ class TestRiskEngine:
         # Last should be high risk
         assert results[2]["overall_score"] >= 0.7
     
+    def test_calculate_overall_risk_without_details(self):
+        """Test the summary-only result matches the full result's headline fields."""
+        engine = RiskEngine()
+        
+        full = engine.calculate_overall_risk("secure-login-bank.xyz")
+        summary = engine.calculate_overall_risk("secure-login-bank.xyz", details=False)
+        
+        assert summary == {
+            "domain": full["domain"],
+            "overall_score": full["overall_score"],
+            "risk_level": full["risk_level"]
+        }
+    
+    def test_domain_components_cached(self):
+        """Test repeat scoring reuses name-derived components but not age."""
+        engine = RiskEngine()
+        
+        first = engine.calculate_overall_risk("secure-login-bank.xyz")
+        second = engine.calculate_overall_risk(
+            "secure-login-bank.xyz",
+            created_date=datetime.utcnow() - timedelta(hours=6)
+        )
+        
+        assert engine._domain_components.cache_info().hits == 1
+        assert first["component_scores"]["keyword_matches"] == second["component_scores"]["keyword_matches"]
+        assert first["component_scores"]["age_days"]["score"] == 0.5
+        assert second["component_scores"]["age_days"]["score"] >= 0.8
+    
+    def test_batch_score_domains_vec(self):
+        """Test vectorized batch scoring matches per-domain scoring."""
+        engine = RiskEngine()
+        
+        domains = [
+            "example.com",
+            "secure-login-bank.xyz",
+            "malware-download-site.top",
+            "x7g9k2p5q.biz",
+            "example"
+        ]
+        
+        created_dates = [
+            datetime.utcnow() - timedelta(days=365),
+            datetime.utcnow() - timedelta(days=2),
+            datetime.utcnow() - timedelta(hours=12),
+            None,
+            datetime.utcnow() - timedelta(days=20)
+        ]
+        
+        scores = engine.batch_score_domains_vec(domains, created_dates)
+        results = engine.batch_score_domains(domains, created_dates)
+        
+        assert scores.shape == (5,)
+        assert [round(float(score), 4) for score in scores] == [r["overall_score"] for r in results]
+    
     def test_update_weights(self):
         """Test weight configuration updates."""
         engine = RiskEngine()
@@ -403,5 +463,43 @@ class TestRiskEngineIntegration:
             assert result["risk_level"] in ["LOW", "VERY_LOW"]
 
 
+
+# Runs one kernel build in a fresh interpreter, reporting cache hits and parfor count
+_KERNEL_BUILD_SCRIPT = """
+import sys
+import numpy as np
+from app import risk_engine_kernels as k
+kernel = getattr(k, sys.argv[1])
+buf = np.frombuffer(b"example", np.uint8)
+kernel(buf, np.array([0, 7], np.int64), np.zeros(256, np.uint8))
+metadata = kernel.overloads[kernel.signatures[0]].metadata or {}
+diagnostics = metadata.get("parfor_diagnostics")
+parfors = len(getattr(diagnostics, "initial_parfors", ()))
+print(sum(kernel.stats.cache_hits.values()), parfors)
+"""
+
+
+class TestKernelCache:
+    """Test that the serial and parallel kernel builds keep separate numba caches."""
+    
+    def _run_build(self, name, cache_dir):
+        env = dict(os.environ, NUMBA_CACHE_DIR=str(cache_dir))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [BACKEND_DIR, env.get("PYTHONPATH")]))
+        out = subprocess.run(
+            [sys.executable, "-c", _KERNEL_BUILD_SCRIPT, name],
+            env=env, capture_output=True, text=True, check=True, cwd=BACKEND_DIR,
+        ).stdout.split()
+        return int(out[-2]), int(out[-1])
+    
+    def test_parallel_build_not_loaded_from_serial_cache(self, tmp_path):
+        """A cache warmed by the serial build doesn't satisfy the parallel one."""
+        self._run_build("_label_stats_serial", tmp_path)
+        
+        cache_hits, parfors = self._run_build("_label_stats_parallel", tmp_path)
+        
+        assert cache_hits == 0
+        assert parfors > 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file